@@ -0,0 +1,65 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class AsyncTTLCache(Generic[T]):
+    """In-process cache whose concurrent misses for the same key share
+    a single call to the loader.
+
+    ``ttl_for`` picks the time to live of each loaded value; returning
+    ``0`` leaves the value uncached.
+    """
+
+    def __init__(self, ttl_for: Callable[[T], float]) -> None:
+        self.ttl_for = ttl_for
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries: dict[Hashable, tuple[float, T]] = {}
+        self._inflight: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry and entry[0] > monotonic():
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, load))
+            task.add_done_callback(lambda done: self._done(key, done))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+
+        # Shielded so a cancelled caller does not cancel the shared load.
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        value = await load()
+        ttl = self.ttl_for(value)
+        if ttl > 0:
+            self._entries[key] = (monotonic() + ttl, value)
+        else:
+            self._entries.pop(key, None)
+        return value
+
+    def _done(self, key: Hashable, task: asyncio.Future[T]) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            task.exception()
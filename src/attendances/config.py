@@ -15,4 +15,36 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES = config(
         'ACCESS_TOKEN_EXPIRE_MINUTES', cast=int, default=30
     )
+    TOKEN_CACHE_SIZE = config('TOKEN_CACHE_SIZE', cast=int, default=1024)
+    BULK_INSERT_CHUNK_SIZE = config('BULK_INSERT_CHUNK_SIZE', cast=int, default=5000)
+    GROUP_COMMIT = config('GROUP_COMMIT', cast=bool, default=False)
+    GROUP_COMMIT_MAX_DELAY_MS = config(
+        'GROUP_COMMIT_MAX_DELAY_MS', cast=float, default=5.0
+    )
+    GROUP_COMMIT_MAX_ROWS = config('GROUP_COMMIT_MAX_ROWS', cast=int, default=200)
+    EXPORT_BATCH_SIZE = config('EXPORT_BATCH_SIZE', cast=int, default=1000)
+    SEARCH_MAX_RANKED = config('SEARCH_MAX_RANKED', cast=int, default=1000)
     COMPANIES_URL = config('COMPANIES_URL', default='http://localhost:8002')
+    COMPANY_CACHE_TTL = config('COMPANY_CACHE_TTL', cast=float, default=300.0)
+    COMPANY_CACHE_NEGATIVE_TTL = config(
+        'COMPANY_CACHE_NEGATIVE_TTL', cast=float, default=30.0
+    )
+    HTTP2 = config('HTTP2', cast=bool, default=False)
+    HTTP_MAX_CONNECTIONS = config('HTTP_MAX_CONNECTIONS', cast=int, default=100)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = config(
+        'HTTP_MAX_KEEPALIVE_CONNECTIONS', cast=int, default=20
+    )
+    HTTP_KEEPALIVE_EXPIRY = config('HTTP_KEEPALIVE_EXPIRY', cast=float, default=5.0)
+    HTTP_TIMEOUT = config('HTTP_TIMEOUT', cast=float, default=5.0)
+    HTTP_CONNECT_TIMEOUT = config('HTTP_CONNECT_TIMEOUT', cast=float, default=5.0)
+    HTTP_POOL_TIMEOUT = config('HTTP_POOL_TIMEOUT', cast=float, default=5.0)
+    STARTUP_TIMEOUT = config('STARTUP_TIMEOUT', cast=float, default=60.0)
+    STARTUP_RETRY_DELAY = config('STARTUP_RETRY_DELAY', cast=float, default=0.1)
+    STARTUP_RETRY_MAX_DELAY = config('STARTUP_RETRY_MAX_DELAY', cast=float, default=2.0)
+    DB_POOL_SIZE = config('DB_POOL_SIZE', cast=int, default=5)
+    DB_MAX_OVERFLOW = config('DB_MAX_OVERFLOW', cast=int, default=10)
+    SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+    SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default='5000')
+    SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default='-16000')
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default='134217728')
@@ -1,9 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from .enums import DocumentType, Gender
+from .enums import DocumentType, Gender, StatsInterval
 
 
 class AttendanceBase(BaseModel):
@@ -25,6 +25,12 @@ class AttendanceCreateMultiple(BaseModel):
     attendances: list[AttendanceCreate]
 
 
+class AttendanceBulkResponse(BaseModel):
+    message: str
+    inserted: int
+    uids: list[UUID] | None = None
+
+
 class AttendanceResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -39,3 +45,45 @@ class AttendanceResponse(BaseModel):
     additional_data: dict[str, object] | None = {}
     company_id: UUID
     created_by: UUID
+
+
+class StatsPeriod(BaseModel):
+    period: date
+    total: int
+
+
+class AttendanceStats(BaseModel):
+    start: date | None
+    end: date | None
+    interval: StatsInterval
+    total: int
+    periods: list[StatsPeriod]
+    reason: dict[str, int]
+    gender: dict[str, int]
+    document_type: dict[str, int]
+    created_by: dict[str, int]
+
+
+class HTTPPoolStats(BaseModel):
+    max_connections: int
+    max_keepalive_connections: int
+    http2: bool
+    connections: int
+    active: int
+    idle: int
+    queued_requests: int
+    unavailable: bool = False
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
+
+
+class GroupCommitStats(BaseModel):
+    enabled: bool
+    batches: int
+    rows: int
+    pending: int
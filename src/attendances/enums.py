@@ -21,3 +21,14 @@ class UserRole(StrEnum):
     ADMIN = 'admin'
     COMPANY_MANAGER = 'company_manager'
     ATTENDANCE_OFFICER = 'attendance_officer'
+
+
+class ExportFormat(StrEnum):
+    CSV = 'csv'
+    XLSX = 'xlsx'
+    NDJSON = 'ndjson'
+
+
+class StatsInterval(StrEnum):
+    DAY = 'day'
+    WEEK = 'week'
@@ -15,3 +15,19 @@ class NoCompanyId(HTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='User does not belong to any company',
         )
+
+
+class InvalidCursor(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid pagination cursor',
+        )
+
+
+class BulkInsertInterrupted(HTTPException):
+    def __init__(self, inserted: int) -> None:
+        super().__init__(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={'error': 'Attendances could not be inserted', 'inserted': inserted},
+        )
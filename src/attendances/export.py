@@ -0,0 +1,167 @@
+import csv
+import tempfile
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timezone
+from enum import Enum
+from io import StringIO
+from typing import Any
+from uuid import UUID
+
+import orjson
+from openpyxl import Workbook
+from sqlalchemy import Row, Select, String, literal
+from starlette.concurrency import run_in_threadpool
+
+from .config import Settings
+from .enums import ExportFormat
+from .models import Attendance
+from .search import apply_search
+
+EXPORT_COLUMNS = (
+    Attendance.uid,
+    Attendance.full_name,
+    Attendance.document,
+    Attendance.document_type,
+    Attendance.gender,
+    Attendance.birth_date,
+    Attendance.address,
+    Attendance.reason,
+    Attendance.additional_data,
+    Attendance.company_id,
+    Attendance.created_by,
+    Attendance.created_at,
+)
+HEADERS = [column.key for column in EXPORT_COLUMNS]
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: 'text/csv',
+    ExportFormat.XLSX: (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    ),
+    ExportFormat.NDJSON: 'application/x-ndjson',
+}
+
+BLOCK_SIZE = 64 * 1024
+
+
+def as_timestamp(value: datetime) -> Any:
+    """Bind ``value`` as text in the format SQLite stores ``func.now()``
+    defaults in; see ``pagination.after_cursor``.
+    """
+    if value.tzinfo:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return literal(value.isoformat(sep=' '), String)
+
+
+def build_export_query(
+    company_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    search: str | None = None,
+) -> Select[Any]:
+    query = Attendance.get_async_query()
+    if company_id:
+        query.find(Attendance.company_id == company_id)
+    if start:
+        query.find(Attendance.created_at >= as_timestamp(start))
+    if end:
+        query.find(Attendance.created_at < as_timestamp(end))
+
+    if search:
+        apply_search(query, search)
+    else:
+        query.sort('-created_at', '-uid')
+
+    return query.query.with_only_columns(*EXPORT_COLUMNS)
+
+
+async def stream_rows(statement: Select[Any]) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Yield the rows of ``statement`` in batches of ``EXPORT_BATCH_SIZE``
+    from a server-side cursor, so only one batch is held at a time.
+    """
+    statement = statement.execution_options(yield_per=Settings.EXPORT_BATCH_SIZE)
+    async with Attendance.AsyncSession() as session:
+        result = await session.stream(statement)
+        async for rows in result.partitions():
+            yield rows
+
+
+def to_cell(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return orjson.dumps(value).decode()
+    return value
+
+
+async def iter_csv(batches: AsyncIterator[Sequence[Row[Any]]]) -> AsyncIterator[bytes]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADERS)
+    async for rows in batches:
+        writer.writerows([to_cell(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def iter_ndjson(
+    batches: AsyncIterator[Sequence[Row[Any]]],
+) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        yield b''.join(orjson.dumps(row._asdict()) + b'\n' for row in rows)
+
+
+def append_rows(sheet: Any, rows: Sequence[Row[Any]]) -> None:
+    for row in rows:
+        sheet.append(
+            [value if isinstance(value, datetime) else to_cell(value) for value in row]
+        )
+
+
+async def iter_xlsx(batches: AsyncIterator[Sequence[Row[Any]]]) -> AsyncIterator[bytes]:
+    """Write the rows with a write-only workbook, which spools each sheet
+    to a temporary file instead of keeping its cells in memory, and then
+    stream the saved workbook.
+
+    The XLSX zip can only be assembled once every row is written, so the
+    first bytes are sent after the last batch is read.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('attendances')
+    sheet.append(HEADERS)
+    async for rows in batches:
+        await run_in_threadpool(append_rows, sheet, rows)
+
+    with tempfile.TemporaryFile() as file:
+        await run_in_threadpool(workbook.save, file)
+        file.seek(0)
+        while block := await run_in_threadpool(file.read, BLOCK_SIZE):
+            yield block
+
+
+WRITERS = {
+    ExportFormat.CSV: iter_csv,
+    ExportFormat.XLSX: iter_xlsx,
+    ExportFormat.NDJSON: iter_ndjson,
+}
+
+
+def export_attendances(
+    export_format: ExportFormat,
+    company_id: UUID | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    search: str | None = None,
+) -> AsyncIterator[bytes]:
+    statement = build_export_query(company_id, start, end, search)
+    return WRITERS[export_format](stream_rows(statement))
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommit(Generic[T]):
+    """Coalesce concurrent single-row writes into one transaction.
+
+    The first row of a batch waits at most ``max_delay`` seconds for
+    others to join it, and a batch is written as soon as it holds
+    ``max_rows`` rows. ``write`` must return one result per row, in
+    order. Batches are written one at a time, so rows arriving during a
+    commit simply form the next batch.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[dict[str, Any]]], Awaitable[list[T]]],
+        max_delay: float,
+        max_rows: int,
+    ) -> None:
+        self.write = write
+        self.max_delay = max_delay
+        self.max_rows = max(max_rows, 1)
+        self.batches = 0
+        self.rows = 0
+        self._pending: list[tuple[dict[str, Any], asyncio.Future[T]]] = []
+        self._has_rows = asyncio.Event()
+        self._full = asyncio.Event()
+        self._closing = False
+        self._worker: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._closing = False
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write the rows still pending and stop the worker."""
+        if self._worker is None:
+            return
+
+        self._closing = True
+        self._has_rows.set()
+        self._full.set()
+        await self._worker
+        self._worker = None
+
+    async def submit(self, values: dict[str, Any]) -> T:
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._pending.append((values, future))
+        self._has_rows.set()
+        if len(self._pending) >= self.max_rows:
+            self._full.set()
+
+        return await future
+
+    def _take(self) -> list[tuple[dict[str, Any], asyncio.Future[T]]]:
+        batch = self._pending[: self.max_rows]
+        del self._pending[: self.max_rows]
+        if not self._pending and not self._closing:
+            self._has_rows.clear()
+        if len(self._pending) < self.max_rows and not self._closing:
+            self._full.clear()
+        return batch
+
+    async def _run(self) -> None:
+        while not (self._closing and not self._pending):
+            await self._has_rows.wait()
+            if len(self._pending) < self.max_rows and self.max_delay > 0:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+                except TimeoutError:
+                    pass
+
+            batch = self._take()
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: list[tuple[dict[str, Any], asyncio.Future[T]]]):
+        try:
+            results = await self.write([values for values, _ in batch])
+        except SQLAlchemyError as e:
+            if len(batch) == 1:
+                self._resolve(batch, exception=e)
+                return
+
+            # Retry the rows one by one so a bad row only fails its caller.
+            for item in batch:
+                await self._write([item])
+            return
+        except Exception as e:
+            logger.exception('Group commit of %d rows failed', len(batch))
+            self._resolve(batch, exception=e)
+            return
+
+        self.batches += 1
+        self.rows += len(batch)
+        self._resolve(batch, results)
+
+    @staticmethod
+    def _resolve(
+        batch: list[tuple[dict[str, Any], asyncio.Future[T]]],
+        results: list[T] | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            elif results is not None:
+                future.set_result(results[index])
@@ -0,0 +1,82 @@
+import httpx
+
+from .config import Settings
+from .metrics import OutboundMetricsTransport
+
+_client: httpx.AsyncClient | None = None
+_transport: httpx.AsyncHTTPTransport | None = None
+
+
+def open_http_client() -> httpx.AsyncClient:
+    global _client, _transport
+
+    if _client is None:
+        _transport = httpx.AsyncHTTPTransport(
+            http2=Settings.HTTP2,
+            limits=httpx.Limits(
+                max_connections=Settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=Settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=Settings.HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _client = httpx.AsyncClient(
+            transport=OutboundMetricsTransport(_transport),
+            timeout=httpx.Timeout(
+                Settings.HTTP_TIMEOUT,
+                connect=Settings.HTTP_CONNECT_TIMEOUT,
+                pool=Settings.HTTP_POOL_TIMEOUT,
+            ),
+        )
+
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client, _transport
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _transport = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide client, opening it lazily if the lifespan
+    has not run (e.g. when the service functions are used from a script).
+    """
+    return open_http_client()
+
+
+def http_pool_stats() -> dict[str, object]:
+    stats: dict[str, object] = {
+        'max_connections': Settings.HTTP_MAX_CONNECTIONS,
+        'max_keepalive_connections': Settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        'http2': Settings.HTTP2,
+        'connections': 0,
+        'active': 0,
+        'idle': 0,
+        'queued_requests': 0,
+        'unavailable': False,
+    }
+    if _transport is None:
+        return stats
+
+    # httpx does not expose pool usage, so it is read from the private
+    # state of the httpcore pool (as of httpx 0.28 / httpcore 1.0). If a
+    # release changes it, the counts are reported as unavailable instead
+    # of failing the endpoint.
+    pool = getattr(_transport, '_pool', None)
+    connections = getattr(pool, 'connections', None)
+    requests = getattr(pool, '_requests', None)
+    try:
+        idle = sum(1 for connection in connections if connection.is_idle())
+        queued = sum(1 for request in requests if request.is_queued())
+    except (AttributeError, TypeError):
+        stats['unavailable'] = True
+        return stats
+
+    stats['connections'] = len(connections)
+    stats['idle'] = idle
+    stats['active'] = len(connections) - idle
+    stats['queued_requests'] = queued
+    return stats
@@ -4,20 +4,46 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi_auth_middleware import AuthMiddleware
-from sqlactive import DBConnection
 
 from .config import Settings
-from .models import BaseModel
+from .database import create_connection
+from .dtos import AttendanceResponse
+from .health import readiness, wait_for_database, warm_up_pool
+from .health import router as health_router
+from .http_client import close_http_client, open_http_client
+from .metrics import MetricsMiddleware, instrument_engine
+from .metrics import router as metrics_router
+from .models import BaseModel, create_missing_indexes
+from .responses import list_adapter
+from .rollups import backfill_rollups
 from .routes import router
+from .search import create_search_index
+from .service import group_commit
 from .token import verify_authorization_header
 
-conn = DBConnection(str(Settings.DATABASE_URL), echo=False)
+conn = create_connection()
+instrument_engine(conn.async_engine)
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    readiness.starting(conn.async_engine)
+    await wait_for_database(conn.async_engine)
     await conn.init_db(BaseModel)
+    async with conn.async_engine.begin() as connection:
+        await connection.run_sync(create_missing_indexes)
+        await connection.run_sync(create_search_index)
+        await connection.run_sync(backfill_rollups)
+    await warm_up_pool(conn.async_engine)
+    open_http_client()
+    list_adapter(AttendanceResponse)
+    if Settings.GROUP_COMMIT:
+        group_commit.start()
+    readiness.mark_ready()
     yield
+    readiness.mark_stopping()
+    await group_commit.stop()
+    await close_http_client()
     await conn.close(BaseModel)
 
 
@@ -28,8 +54,12 @@ app.add_middleware(
     allow_origins=['*'],
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=['X-Next-Cursor'],
 )
 app.add_middleware(AuthMiddleware, verify_header=verify_authorization_header)  # type: ignore
+app.add_middleware(MetricsMiddleware)
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(router)
 
 if __name__ == '__main__':
@@ -0,0 +1,137 @@
+from contextvars import ContextVar
+from time import perf_counter
+
+import httpx
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+router = APIRouter()
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Time spent handling a request, until its body was sent.',
+    ['method', 'route', 'status'],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', 'Requests being handled right now.'
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Database queries run by a request.',
+    ['route'],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500, 1000),
+)
+REQUEST_DB_SECONDS = Histogram(
+    'http_request_db_seconds',
+    'Time a request spent in database queries.',
+    ['route'],
+)
+DB_QUERY_LATENCY = Histogram(
+    'db_query_duration_seconds', 'Time spent in one database query.', ['operation']
+)
+OUTBOUND_LATENCY = Histogram(
+    'http_client_request_duration_seconds',
+    'Time until the response headers of a call to another service arrived.',
+    ['target', 'method', 'status'],
+)
+
+# [queries, seconds] of the request being handled.
+request_db_usage: ContextVar[list[float] | None] = ContextVar(
+    'request_db_usage', default=None
+)
+
+
+class MetricsMiddleware:
+    """Record the latency, status and database usage of every request.
+
+    The route template (``/users/{uid}``) is used as label, so paths with
+    identifiers do not create a series each.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        usage = [0.0, 0.0]
+        token = request_db_usage.set(usage)
+        REQUESTS_IN_FLIGHT.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            request_db_usage.reset(token)
+            route = getattr(scope.get('route'), 'path', 'unmatched')
+            REQUEST_LATENCY.labels(scope['method'], route, status).observe(elapsed)
+            REQUEST_DB_QUERIES.labels(route).observe(usage[0])
+            REQUEST_DB_SECONDS.labels(route).observe(usage[1])
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - conn.info['query_start'].pop()
+    operation = statement.lstrip().split(' ', 1)[0].upper()
+    DB_QUERY_LATENCY.labels(operation).observe(elapsed)
+    usage = request_db_usage.get()
+    if usage is not None:
+        usage[0] += 1
+        usage[1] += elapsed
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', after_cursor_execute)
+
+
+class OutboundMetricsTransport(httpx.AsyncBaseTransport):
+    """Time the calls to other services, by target host (the compose
+    service name in a deployment). Calls that fail without a response,
+    e.g. on a timeout or a refused connection, get the ``error`` status.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        status: int | str = 'error'
+        start = perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+            status = response.status_code
+            return response
+        finally:
+            OUTBOUND_LATENCY.labels(request.url.host, request.method, status).observe(
+                perf_counter() - start
+            )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@router.get('/metrics', tags=['internal'])
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
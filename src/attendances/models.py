@@ -1,13 +1,25 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlactive import ActiveRecordBaseModel
-from sqlalchemy import JSON, Enum
+from sqlalchemy import JSON, TIMESTAMP, Connection, Enum, Index, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .enums import DocumentType, Gender
 
+# Timestamps bound from Python are stored like the ``func.now()`` defaults
+# on SQLite, so both sort and compare as the same text.
+CREATED_AT_TYPE = TIMESTAMP(timezone=False).with_variant(
+    sqlite.DATETIME(
+        storage_format=(
+            '%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d'
+        )
+    ),
+    'sqlite',
+)
+
 
 class BaseModel(ActiveRecordBaseModel):
     __abstract__ = True
@@ -31,3 +43,40 @@ class Attendance(BaseModel):
     )
     company_id: Mapped[UUID] = mapped_column()
     created_by: Mapped[UUID] = mapped_column()
+    created_at: Mapped[datetime] = mapped_column(
+        CREATED_AT_TYPE, default=func.now(), nullable=False
+    )
+
+
+class AttendanceRollup(BaseModel):
+    """Number of attendances per company, day and value of a dimension
+    (``reason``, ``gender``, ...); the ``total`` dimension counts them all.
+    """
+
+    __tablename__ = 'attendance_rollups'
+
+    company_id: Mapped[UUID] = mapped_column(primary_key=True)
+    dimension: Mapped[str] = mapped_column(primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True)
+    value: Mapped[str] = mapped_column(primary_key=True)
+    total: Mapped[int] = mapped_column(default=0)
+
+
+Index(
+    'ix_attendances_company_id_created_at_uid',
+    Attendance.company_id,
+    Attendance.created_at.desc(),
+    Attendance.uid.desc(),
+)
+Index(
+    'ix_attendances_company_id_document',
+    Attendance.company_id,
+    Attendance.document,
+)
+Index('ix_attendances_created_by', Attendance.created_by)
+
+
+def create_missing_indexes(connection: Connection) -> None:
+    """Create the indexes that ``create_all`` skips on existing tables."""
+    for index in Attendance.__table__.indexes:
+        index.create(connection, checkfirst=True)
@@ -0,0 +1,59 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, String, literal, tuple_
+
+from .errors import InvalidCursor
+
+
+def encode_cursor(created_at: datetime, uid: UUID) -> str:
+    raw = f'{created_at.isoformat()}|{uid.hex}'.encode()
+    return urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        raw = urlsafe_b64decode(cursor + padding).decode()
+        created_at, uid = raw.split('|')
+        return datetime.fromisoformat(created_at), UUID(hex=uid)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor
+
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def page_size(limit: int) -> int:
+    return limit if limit > 0 else DEFAULT_PAGE_SIZE
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> str | None:
+    if not rows or len(rows) < page_size(limit):
+        return None
+
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.uid)
+
+
+def after_cursor(
+    created_at_column: Any, uid_column: Any, cursor: str
+) -> ColumnElement[bool]:
+    """Filter rows strictly after ``cursor`` in ``(created_at, uid)``
+    descending order.
+
+    The timestamp is bound as text in ISO format because SQLite stores
+    ``func.now()`` defaults as ``YYYY-MM-DD HH:MM:SS`` and the DateTime
+    bind processor would always append microseconds, breaking equality.
+    A row-value comparison is used so the index can seek straight to the
+    cursor position.
+    """
+    created_at, uid = decode_cursor(cursor)
+    return tuple_(created_at_column, uid_column) < tuple_(
+        literal(created_at.isoformat(sep=' '), String),
+        literal(uid, uid_column.type),
+    )
@@ -0,0 +1,167 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, timedelta
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Connection, Date, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .dtos import AttendanceStats, StatsPeriod
+from .enums import StatsInterval
+from .models import Attendance, AttendanceRollup
+
+TOTAL = 'total'
+DIMENSIONS = {
+    'reason': Attendance.reason,
+    'gender': Attendance.gender,
+    'document_type': Attendance.document_type,
+    'created_by': Attendance.created_by,
+}
+
+
+def bucket_value(value: Any) -> str:
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def count_rollups(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    counts: Counter[tuple[UUID, date, str, str]] = Counter()
+    for row in rows:
+        company_id, day = row['company_id'], row['created_at'].date()
+        counts[company_id, day, TOTAL, ''] += 1
+        for dimension in DIMENSIONS:
+            value = bucket_value(row[dimension])
+            counts[company_id, day, dimension, value] += 1
+
+    return [
+        {
+            'company_id': company_id,
+            'dimension': dimension,
+            'day': day,
+            'value': value,
+            'total': total,
+        }
+        for (company_id, day, dimension, value), total in counts.items()
+    ]
+
+
+def upsert_rollups_statement(dialect_name: str) -> Any:
+    """Insert rollup rows, adding their totals to the existing ones."""
+    table = AttendanceRollup.__table__
+    if dialect_name == 'mysql':
+        statement = mysql_insert(table)
+        return statement.on_duplicate_key_update(
+            total=table.c.total + statement.inserted.total, updated_at=func.now()
+        )
+
+    statement = sqlite_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=list(table.primary_key.columns),
+        set_={
+            'total': table.c.total + statement.excluded.total,
+            'updated_at': func.now(),
+        },
+    )
+
+
+async def add_to_rollups(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Count ``rows`` in the rollups within the transaction of ``session``
+    that inserts them.
+
+    Each row is counted on the day of its own ``created_at``, so the
+    rollups always agree with the stored timestamps.
+    """
+    values = count_rollups(rows)
+    if values:
+        statement = upsert_rollups_statement(session.bind.dialect.name)
+        await session.execute(statement, values)
+
+
+def backfill_rollups(connection: Connection) -> None:
+    """Roll up the attendances stored before the rollup table existed."""
+    if connection.execute(select(AttendanceRollup.company_id).limit(1)).first():
+        return
+
+    day = func.date(Attendance.created_at, type_=Date)
+    statement = upsert_rollups_statement(connection.dialect.name)
+    groups: list[tuple[str, Any]] = [(TOTAL, None), *DIMENSIONS.items()]
+    for dimension, column in groups:
+        keys = [Attendance.company_id, day] + ([column] if column is not None else [])
+        rows = connection.execute(select(*keys, func.count()).group_by(*keys)).all()
+        values = [
+            {
+                'company_id': row[0],
+                'dimension': dimension,
+                'day': row[1],
+                'value': bucket_value(row[2]) if column is not None else '',
+                'total': row[-1],
+            }
+            for row in rows
+        ]
+        if values:
+            connection.execute(statement, values)
+
+
+def period_of(day: date, interval: StatsInterval) -> date:
+    if interval == StatsInterval.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+async def fetch_stats(
+    company_id: UUID | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    interval: StatsInterval = StatsInterval.DAY,
+) -> AttendanceStats:
+    """Aggregate the rollups between ``start`` (inclusive) and ``end``
+    (exclusive); weeks start on Monday.
+    """
+    filters = []
+    if company_id:
+        filters.append(AttendanceRollup.company_id == company_id)
+    if start:
+        filters.append(AttendanceRollup.day >= start)
+    if end:
+        filters.append(AttendanceRollup.day < end)
+
+    async with AttendanceRollup.AsyncSession() as session:
+        breakdown = await session.execute(
+            select(
+                AttendanceRollup.dimension,
+                AttendanceRollup.value,
+                func.sum(AttendanceRollup.total),
+            )
+            .where(*filters, AttendanceRollup.dimension != TOTAL)
+            .group_by(AttendanceRollup.dimension, AttendanceRollup.value)
+        )
+        days = await session.execute(
+            select(AttendanceRollup.day, func.sum(AttendanceRollup.total))
+            .where(*filters, AttendanceRollup.dimension == TOTAL)
+            .group_by(AttendanceRollup.day)
+        )
+
+    dimensions: dict[str, dict[str, int]] = {name: {} for name in DIMENSIONS}
+    for dimension, value, total in breakdown:
+        dimensions[dimension][value] = total
+
+    periods: Counter[date] = Counter()
+    for day, total in days:
+        periods[period_of(day, interval)] += total
+
+    return AttendanceStats(
+        start=start,
+        end=end,
+        interval=interval,
+        total=sum(periods.values()),
+        periods=[
+            StatsPeriod(period=period, total=total)
+            for period, total in sorted(periods.items())
+        ],
+        **dimensions,
+    )
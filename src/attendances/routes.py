@@ -1,21 +1,34 @@
+from datetime import date, datetime
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from starlette.authentication import requires
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
 
 from .dtos import (
+    AttendanceBulkResponse,
     AttendanceCreate,
     AttendanceCreateMultiple,
     AttendanceResponse,
+    AttendanceStats,
+    CacheStats,
+    GroupCommitStats,
+    HTTPPoolStats,
 )
-from .enums import UserRole
+from .enums import ExportFormat, StatsInterval, UserRole
 from .errors import AttendanceNotFound, NoCompanyId
+from .export import MEDIA_TYPES, export_attendances
+from .http_client import http_pool_stats
+from .pagination import next_cursor
+from .responses import list_response
+from .rollups import fetch_stats
 from .service import (
+    company_cache,
     create_multiple_attendances,
     create_new_attendance,
     fetch_attendances,
+    group_commit,
     read_attendance,
 )
 
@@ -50,15 +63,50 @@ async def get_attendances(
     skip: int = 0,
     limit: int = 100,
     search: str | None = None,
+    cursor: str | None = None,
 ):
     check_company_id(request)
     attendances = await fetch_attendances(
-        request.user.company_id, skip, limit, search
+        request.user.company_id, skip, limit, search, cursor
     )
-    return [
-        AttendanceResponse.model_validate(attendance)
-        for attendance in attendances
-    ]
+    headers: dict[str, str] = {}
+    if not search and (next_page := next_cursor(attendances, limit)):
+        headers['X-Next-Cursor'] = next_page
+
+    return list_response(AttendanceResponse, attendances, headers)
+
+
+@router.get('/attendances/export', tags=['attendances'])
+@requires(UserRole.ATTENDANCE_OFFICER)
+async def export(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias='format'),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    search: str | None = None,
+):
+    check_company_id(request)
+    return StreamingResponse(
+        export_attendances(export_format, request.user.company_id, start, end, search),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="attendances.{export_format.value}"'
+            )
+        },
+    )
+
+
+@router.get('/attendances/stats', response_model=AttendanceStats, tags=['attendances'])
+@requires(UserRole.COMPANY_MANAGER)
+async def get_stats(
+    request: Request,
+    start: date | None = None,
+    end: date | None = None,
+    interval: StatsInterval = StatsInterval.DAY,
+):
+    check_company_id(request)
+    return await fetch_stats(request.user.company_id, start, end, interval)
 
 
 @router.get(
@@ -78,11 +126,46 @@ async def get_attendance(request: Request, uid: UUID):
 
 @router.post(
     '/attendances/multiple',
-    response_model=AttendanceResponse,
+    response_model=AttendanceBulkResponse,
+    response_model_exclude_none=True,
     tags=['attendances'],
 )
 @requires(UserRole.ATTENDANCE_OFFICER)
-async def create_multiple(request: Request, data: AttendanceCreateMultiple):
+async def create_multiple(
+    request: Request, data: AttendanceCreateMultiple, return_uids: bool = False
+):
     check_company_id(request)
-    await create_multiple_attendances(request.user, data)
-    return JSONResponse({'message': 'Asistencias importadas correctamente'})
+    uids = await create_multiple_attendances(request.user, data)
+    return AttendanceBulkResponse(
+        message='Asistencias importadas correctamente',
+        inserted=len(uids),
+        uids=uids if return_uids else None,
+    )
+
+
+@router.get('/http-pool/stats', response_model=HTTPPoolStats, tags=['internal'])
+@requires(UserRole.ADMIN)
+async def get_http_pool_stats(request: Request):
+    return HTTPPoolStats(**http_pool_stats())
+
+
+@router.get('/company-cache/stats', response_model=CacheStats, tags=['internal'])
+@requires(UserRole.ADMIN)
+async def get_company_cache_stats(request: Request):
+    return CacheStats(
+        hits=company_cache.hits,
+        misses=company_cache.misses,
+        coalesced=company_cache.coalesced,
+        size=len(company_cache),
+    )
+
+
+@router.get('/group-commit/stats', response_model=GroupCommitStats, tags=['internal'])
+@requires(UserRole.ADMIN)
+async def get_group_commit_stats(request: Request):
+    return GroupCommitStats(
+        enabled=group_commit.running,
+        batches=group_commit.batches,
+        rows=group_commit.rows,
+        pending=len(group_commit),
+    )
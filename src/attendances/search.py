@@ -0,0 +1,132 @@
+import re
+from uuid import UUID
+
+from sqlactive.async_query import AsyncQuery
+from sqlalchemy import Connection, column, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+
+from .config import Settings
+from .models import Attendance
+
+FTS_TABLE = 'attendances_fts'
+KEY_COLUMNS = ('uid', 'company_id')
+FTS_COLUMNS = ('full_name', 'document', 'address', 'reason')
+
+attendances_fts = table(FTS_TABLE, column('rowid'), column('uid'), column('rank'))
+
+_fts_enabled = False
+
+
+def _statements() -> list[str]:
+    """The FTS5 table keeps its own copy of the searched columns under the
+    attendance ``uid``, rather than pointing at the implicit rowid of
+    ``attendances``, which ``VACUUM`` may renumber. ``company_id`` is
+    indexed too, so that a search only matches, and ranks, the rows of
+    one company.
+    """
+    columns = ', '.join(KEY_COLUMNS + FTS_COLUMNS)
+    new_values = ', '.join(f'new.{name}' for name in KEY_COLUMNS + FTS_COLUMNS)
+    delete = (
+        f'DELETE FROM {FTS_TABLE} '
+        f"WHERE {FTS_TABLE} MATCH 'uid : \"' || old.uid || '\"';"
+    )
+    insert = f'INSERT INTO {FTS_TABLE}({columns}) VALUES ({new_values});'
+    create_table = (
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5('
+        f"{columns}, tokenize='unicode61 remove_diacritics 2')"
+    )
+    on_insert = (
+        f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON attendances '
+        f'BEGIN {insert} END'
+    )
+    on_delete = (
+        f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON attendances '
+        f'BEGIN {delete} END'
+    )
+    on_update = (
+        f'CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON attendances '
+        f'BEGIN {delete} {insert} END'
+    )
+    return [create_table, on_insert, on_delete, on_update]
+
+
+def create_search_index(connection: Connection) -> None:
+    """Create the FTS5 index and its sync triggers on SQLite.
+
+    Other backends, or SQLite builds without FTS5, keep using the
+    ``LIKE`` based search from sqlactive.
+    """
+    global _fts_enabled
+
+    if connection.dialect.name != 'sqlite':
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': FTS_TABLE},
+    ).first()
+
+    try:
+        for statement in _statements():
+            connection.execute(text(statement))
+    except OperationalError:
+        return
+
+    if not exists:
+        # The keys only restrict a search, so they weigh nothing in bm25.
+        weights = ', '.join(['0'] * len(KEY_COLUMNS) + ['1'] * len(FTS_COLUMNS))
+        connection.execute(
+            text(f'INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES (:name, :rank)'),
+            {'name': 'rank', 'rank': f'bm25({weights})'},
+        )
+        columns = ', '.join(KEY_COLUMNS + FTS_COLUMNS)
+        connection.execute(
+            text(
+                f'INSERT INTO {FTS_TABLE}({columns}) '
+                f'SELECT {columns} FROM attendances ORDER BY created_at, uid'
+            )
+        )
+
+    _fts_enabled = True
+
+
+def to_match_expression(search: str, company_id: UUID | None = None) -> str:
+    """Quote every term of ``search`` as an FTS5 prefix query over the
+    searched columns, restricted to ``company_id`` when given.
+    """
+    terms = re.findall(r'\w+', search)
+    if not terms:
+        return ''
+
+    prefixes = ' '.join(f'"{term}"*' for term in terms)
+    expression = f'{{{" ".join(FTS_COLUMNS)}}} : ({prefixes})'
+    if company_id:
+        expression = f'company_id : "{company_id.hex}" AND {expression}'
+
+    return expression
+
+
+def apply_search(
+    query: AsyncQuery[Attendance], search: str, company_id: UUID | None = None
+) -> None:
+    expression = to_match_expression(search, company_id) if _fts_enabled else ''
+    if not expression:
+        query.search(search).sort('-created_at', '-uid')
+        return
+
+    matches = select(attendances_fts.c.uid, attendances_fts.c.rank).where(
+        literal_column(FTS_TABLE).op('MATCH')(expression)
+    )
+    if Settings.SEARCH_MAX_RANKED > 0:
+        # Only the latest matches are ranked, so a term common in the
+        # company costs the same however many rows it matches.
+        matches = matches.order_by(attendances_fts.c.rowid.desc()).limit(
+            Settings.SEARCH_MAX_RANKED
+        )
+    ranked = matches.subquery('matches')
+
+    query.query = query.query.join(ranked, ranked.c.uid == Attendance.uid).order_by(
+        ranked.c.rank,
+        Attendance.created_at.desc(),
+        Attendance.uid.desc(),
+    )
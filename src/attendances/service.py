@@ -1,37 +1,66 @@
 import json
-from uuid import UUID
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
 
-import httpx
-from fastapi import HTTPException
+from fastapi import HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import AsyncTTLCache
 from .config import Settings
 from .dtos import AttendanceCreate, AttendanceCreateMultiple
 from .enums import UserRole
-from .errors import NoCompanyId
+from .errors import BulkInsertInterrupted, NoCompanyId
+from .group_commit import GroupCommit
+from .http_client import get_http_client
 from .models import Attendance
+from .pagination import after_cursor, page_size
+from .rollups import add_to_rollups
+from .search import apply_search
 from .token import AuthenticatedUser
 
 
 async def fetch_user_company(access_token: str):
-    async with httpx.AsyncClient() as client:
-        return await client.get(
-            f'{Settings.COMPANIES_URL}/companies/me',
-            headers={'Authorization': 'Bearer ' + access_token},
-        )
+    return await get_http_client().get(
+        f'{Settings.COMPANIES_URL}/companies/me',
+        headers={'Authorization': 'Bearer ' + access_token},
+    )
+
+
+def company_check_ttl(failure: tuple[int, Any] | None) -> float:
+    if failure is None:
+        return Settings.COMPANY_CACHE_TTL
+    if failure[0] == status.HTTP_404_NOT_FOUND:
+        return Settings.COMPANY_CACHE_NEGATIVE_TTL
+    return 0
+
 
+company_cache: AsyncTTLCache[tuple[int, Any] | None] = AsyncTTLCache(
+    company_check_ttl
+)
 
-async def check_company_exists(access_token: str):
+
+async def load_company_failure(access_token: str) -> tuple[int, Any] | None:
     company_response = await fetch_user_company(access_token)
-    if company_response.is_error:
-        try:
-            detail = company_response.json()['detail']
-        except (json.decoder.JSONDecodeError, KeyError):
-            detail = company_response.text
+    if not company_response.is_error:
+        return None
 
-        raise HTTPException(
-            status_code=company_response.status_code,
-            detail=detail,
-        )
+    try:
+        detail = company_response.json()['detail']
+    except (json.decoder.JSONDecodeError, KeyError):
+        detail = company_response.text
+
+    return company_response.status_code, detail
+
+
+async def check_company_exists(company_id: UUID, access_token: str):
+    failure = await company_cache.get(
+        company_id, lambda: load_company_failure(access_token)
+    )
+    if failure:
+        status_code, detail = failure
+        raise HTTPException(status_code=status_code, detail=detail)
 
 
 async def fetch_attendances(
@@ -39,16 +68,25 @@ async def fetch_attendances(
     skip: int = 0,
     limit: int = 100,
     search: str | None = None,
+    cursor: str | None = None,
 ):
     query = Attendance.get_async_query()
-    query.skip(skip).limit(limit if limit > 0 else 100).sort('-created_at')
-
-    if search:
-        query.search(search)
+    query.limit(page_size(limit))
 
     if company_id:
         query.find(Attendance.company_id == company_id)
 
+    if search:
+        apply_search(query, search, company_id)
+        query.skip(skip)
+        return await query.all()
+
+    query.sort('-created_at', '-uid')
+    if cursor:
+        query.find(after_cursor(Attendance.created_at, Attendance.uid, cursor))
+    else:
+        query.skip(skip)
+
     return await query.all()
 
 
@@ -63,34 +101,117 @@ async def read_attendance(read_by: AuthenticatedUser, uid: UUID):
     return attendance
 
 
+def creation_time() -> datetime:
+    """Return the UTC time, to the second, to store as ``created_at``.
+
+    It is taken once in Python rather than from the database clock, so
+    the rollups count a row on the same day as its timestamp, whatever
+    the time zone of the database session.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
 async def create_new_attendance(created_by: AuthenticatedUser, data: AttendanceCreate):
     if not created_by.company_id:
         raise NoCompanyId
 
-    await check_company_exists(created_by.access_token)
+    await check_company_exists(created_by.company_id, created_by.access_token)
 
-    return await Attendance.create(
+    values = {
         **data.model_dump(),
-        company_id=created_by.company_id,
-        created_by=created_by.uid,
-    )
+        'company_id': created_by.company_id,
+        'created_by': created_by.uid,
+        'created_at': creation_time(),
+    }
+    if group_commit.running:
+        return await group_commit.submit(values)
+
+    attendance = Attendance(**values)
+    async with Attendance.AsyncSession() as session:
+        try:
+            session.add(attendance)
+            await session.flush()
+            await add_to_rollups(session, [values])
+            await session.commit()
+            await session.refresh(attendance)
+        except SQLAlchemyError:
+            await session.rollback()
+            raise
+
+    return attendance
+
+
+async def write_attendances(rows: list[dict[str, Any]]) -> list[Attendance]:
+    """Insert ``rows`` in one transaction and return their attendances,
+    in the order of ``rows``.
+    """
+    statement = insert(Attendance).returning(Attendance, sort_by_parameter_order=True)
+    async with Attendance.AsyncSession() as session:
+        try:
+            attendances = list(await session.scalars(statement, rows))
+            await add_to_rollups(session, rows)
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            raise
+
+    return attendances
+
+
+group_commit: GroupCommit[Attendance] = GroupCommit(
+    write_attendances,
+    Settings.GROUP_COMMIT_MAX_DELAY_MS / 1000,
+    Settings.GROUP_COMMIT_MAX_ROWS,
+)
+
+
+async def insert_attendances(rows: list[dict[str, Any]]) -> int:
+    """Insert ``rows`` with Core ``executemany`` statements, committing
+    every ``BULK_INSERT_CHUNK_SIZE`` rows.
+
+    This skips the unit of work and the ORM object it would build for
+    every row. ``updated_at`` still comes from its column default, which
+    is rendered inline in the statement. Each chunk updates the rollups
+    in the same transaction.
+    """
+    statement = insert(Attendance.__table__)
+    chunk_size = max(Settings.BULK_INSERT_CHUNK_SIZE, 1)
+    inserted = 0
+    async with Attendance.AsyncSession() as session:
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            try:
+                await session.execute(statement, chunk)
+                await add_to_rollups(session, chunk)
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                raise BulkInsertInterrupted(inserted)
+            inserted += len(chunk)
+
+    return inserted
 
 
 async def create_multiple_attendances(
     created_by: AuthenticatedUser, data: AttendanceCreateMultiple
-):
+) -> list[UUID]:
     if not created_by.company_id:
         raise NoCompanyId
 
-    await check_company_exists(created_by.access_token)
+    await check_company_exists(created_by.company_id, created_by.access_token)
 
-    await Attendance.insert_all(
+    uids = [uuid4() for _ in data.attendances]
+    created_at = creation_time()
+    await insert_attendances(
         [
-            Attendance(
+            {
                 **attendance.model_dump(),
-                company_id=created_by.company_id,
-                created_by=created_by.uid,
-            )
-            for attendance in data.attendances
+                'uid': uid,
+                'company_id': created_by.company_id,
+                'created_by': created_by.uid,
+                'created_at': created_at,
+            }
+            for uid, attendance in zip(uids, data.attendances)
         ]
     )
+    return uids
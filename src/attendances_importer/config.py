@@ -5,10 +5,48 @@ config = Config()
 
 
 class Settings:
+    DATABASE_URL = config(
+        'IMPORTER_DATABASE_URL',
+        cast=Secret,
+        default='sqlite+aiosqlite:///./db/import_jobs.sqlite3',
+    )
     SECRET_KEY = config('SECRET_KEY', cast=Secret, default='your-secret-key')
     ALGORITHM = config('ALGORITHM', default='HS256')
     ACCESS_TOKEN_EXPIRE_MINUTES = config(
         'ACCESS_TOKEN_EXPIRE_MINUTES', cast=int, default=30
     )
+    TOKEN_CACHE_SIZE = config('TOKEN_CACHE_SIZE', cast=int, default=1024)
     MAX_ROWS = config('MAX_ROWS', cast=int, default=10001)
+    IMPORT_CHUNK_SIZE = config('IMPORT_CHUNK_SIZE', cast=int, default=1000)
+    IMPORT_VALIDATION_BATCH_SIZE = config(
+        'IMPORT_VALIDATION_BATCH_SIZE', cast=int, default=100
+    )
+    IMPORT_MAX_ROW_ERRORS = config('IMPORT_MAX_ROW_ERRORS', cast=int, default=100)
+    IMPORT_MAX_CONCURRENCY = config('IMPORT_MAX_CONCURRENCY', cast=int, default=4)
+    IMPORT_WORKERS = config('IMPORT_WORKERS', cast=int, default=2)
+    IMPORT_PROCESSES = config('IMPORT_PROCESSES', cast=int, default=2)
+    IMPORT_PROCESS_MEMORY_LIMIT = config(
+        'IMPORT_PROCESS_MEMORY_LIMIT', cast=int, default=1024
+    )
+    IMPORT_PARSE_TIMEOUT = config('IMPORT_PARSE_TIMEOUT', cast=float, default=600.0)
+    IMPORT_JOBS_DIR = config('IMPORT_JOBS_DIR', default='./db/imports')
     ATTENDANCES_URL = config('ATTENDANCES_URL', default='http://localhost:8003')
+    HTTP2 = config('HTTP2', cast=bool, default=False)
+    HTTP_MAX_CONNECTIONS = config('HTTP_MAX_CONNECTIONS', cast=int, default=100)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = config(
+        'HTTP_MAX_KEEPALIVE_CONNECTIONS', cast=int, default=20
+    )
+    HTTP_KEEPALIVE_EXPIRY = config('HTTP_KEEPALIVE_EXPIRY', cast=float, default=5.0)
+    HTTP_TIMEOUT = config('HTTP_TIMEOUT', cast=float, default=5.0)
+    HTTP_CONNECT_TIMEOUT = config('HTTP_CONNECT_TIMEOUT', cast=float, default=5.0)
+    HTTP_POOL_TIMEOUT = config('HTTP_POOL_TIMEOUT', cast=float, default=5.0)
+    STARTUP_TIMEOUT = config('STARTUP_TIMEOUT', cast=float, default=60.0)
+    STARTUP_RETRY_DELAY = config('STARTUP_RETRY_DELAY', cast=float, default=0.1)
+    STARTUP_RETRY_MAX_DELAY = config('STARTUP_RETRY_MAX_DELAY', cast=float, default=2.0)
+    DB_POOL_SIZE = config('DB_POOL_SIZE', cast=int, default=5)
+    DB_MAX_OVERFLOW = config('DB_MAX_OVERFLOW', cast=int, default=10)
+    SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+    SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default='5000')
+    SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default='-16000')
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default='134217728')
@@ -1,8 +1,9 @@
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .enums import DocumentType, Gender
+from .enums import DocumentType, Gender, ImportJobStatus, ImportRecordStatus
 
 
 class AttendanceBase(BaseModel):
@@ -24,7 +25,64 @@ class AttendanceCreateMultiple(BaseModel):
     attendances: list[AttendanceCreate]
 
 
+class ImportChunkResult(BaseModel):
+    index: int
+    rows: int
+    response: dict[str, object]
+
+
 class AttendanceImportResponse(BaseModel):
     attendances: list[AttendanceCreate]
     insertion_response: dict[str, object]
     file_extension: str
+    inserted: int = 0
+    chunks: list[ImportChunkResult] = []
+
+
+class AttendanceImportSummary(BaseModel):
+    file_extension: str
+    parsed: int
+    validated: int
+    inserted: int
+    elapsed: float
+    error: object | None = None
+
+
+class ImportJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    uid: UUID
+    status: ImportJobStatus
+    file_extension: str
+    rows_parsed: int
+    rows_validated: int
+    rows_inserted: int
+    result: dict[str, object] | None = None
+    error: object | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class ImportRecordResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    fingerprint: str
+    status: ImportRecordStatus
+    file_extension: str
+    rows_inserted: int | None = None
+    result: dict[str, object] | None = None
+    error: object | None = None
+    job_uid: UUID | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class HTTPPoolStats(BaseModel):
+    max_connections: int
+    max_keepalive_connections: int
+    http2: bool
+    connections: int
+    active: int
+    idle: int
+    queued_requests: int
+    unavailable: bool = False
@@ -21,3 +21,22 @@ class UserRole(StrEnum):
     ADMIN = 'admin'
     COMPANY_MANAGER = 'company_manager'
     ATTENDANCE_OFFICER = 'attendance_officer'
+
+
+class ImportJobStatus(StrEnum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+
+class ImportResponseMode(StrEnum):
+    FULL = 'full'
+    SUMMARY = 'summary'
+    NDJSON = 'ndjson'
+
+
+class ImportRecordStatus(StrEnum):
+    IN_PROGRESS = 'in_progress'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
@@ -25,9 +25,65 @@ class NoActiveSheet(HTTPException):
         )
 
 
+class InvalidEncoding(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='File must be UTF-8 encoded',
+        )
+
+
+class UnreadableFile(HTTPException):
+    def __init__(self, file_extension: str) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'File is not a valid .{file_extension} file',
+        )
+
+
 class RowValidationError(HTTPException):
-    def __init__(self, row: int, detail: str) -> None:
+    def __init__(self, errors: list[dict[str, object]]) -> None:
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'Row validation error: {row} - {detail}',
+            detail={'message': 'Row validation error', 'errors': errors},
+        )
+
+
+class ImportInterrupted(HTTPException):
+    def __init__(self, status_code: int, detail: object, inserted: int) -> None:
+        super().__init__(
+            status_code=status_code,
+            detail={'error': detail, 'inserted': inserted},
+        )
+
+
+class ImportInProgress(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail='An import of this file is already in progress',
+        )
+
+
+class ImportJobNotFound(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Import job was not found',
+        )
+
+
+class ParseTimeout(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_408_REQUEST_TIMEOUT,
+            detail='File parsing timed out',
+        )
+
+
+class ParseFailed(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail='File parsing failed unexpectedly',
         )
@@ -0,0 +1,131 @@
+import hashlib
+from collections.abc import Collection
+from typing import IO, Any
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .enums import ImportRecordStatus
+from .models import ImportRecord
+
+BLOCK_SIZE = 1024 * 1024
+INTERRUPTED = 'Import was interrupted by a service restart'
+
+
+def fingerprint_upload(file: IO[bytes], company_id: UUID | None) -> str:
+    """Hash the upload block by block, salted with ``company_id`` so the
+    same spreadsheet imported by two companies is not a duplicate.
+    """
+    digest = hashlib.sha256(str(company_id or '').encode())
+    file.seek(0)
+    while block := file.read(BLOCK_SIZE):
+        digest.update(block)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def can_retry(record: ImportRecord, force: bool) -> bool:
+    """Whether the import of ``record`` may be started again: never while
+    it is in progress, and without ``force`` only after a failure that
+    is known to have inserted nothing.
+    """
+    if record.status == ImportRecordStatus.IN_PROGRESS:
+        return False
+
+    return force or (
+        record.status == ImportRecordStatus.FAILED and record.rows_inserted == 0
+    )
+
+
+async def claim_import(
+    fingerprint: str, created_by: UUID, file_extension: str, force: bool = False
+) -> ImportRecord | None:
+    """Record the import of ``fingerprint`` as in progress.
+
+    Returns ``None`` once it is claimed, or the record of the earlier
+    import that prevents it. Of concurrent uploads of the same file,
+    only one can claim it.
+    """
+    values = {
+        'status': ImportRecordStatus.IN_PROGRESS,
+        'file_extension': file_extension,
+        'rows_inserted': 0,
+        'result': None,
+        'error': None,
+        'job_uid': None,
+        'created_by': created_by,
+    }
+    try:
+        await ImportRecord.create(fingerprint=fingerprint, **values)
+        return None
+    except IntegrityError:
+        pass
+
+    previous = await ImportRecord.get(fingerprint)
+    if previous is None or not can_retry(previous, force):
+        return previous
+
+    # Taking the record over only succeeds if it is not in progress yet,
+    # so concurrent retries cannot both claim it.
+    statement = (
+        update(ImportRecord)
+        .where(
+            ImportRecord.fingerprint == fingerprint,
+            ImportRecord.status != ImportRecordStatus.IN_PROGRESS,
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    async with ImportRecord.AsyncSession() as session:
+        try:
+            claimed = (await session.execute(statement)).rowcount
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            raise
+
+    if claimed:
+        return None
+
+    return await ImportRecord.get(fingerprint)
+
+
+async def update_import(fingerprint: str, **values: Any) -> None:
+    record = await ImportRecord.get(fingerprint)
+    if record:
+        await record.update(**values)
+
+
+async def record_import(
+    fingerprint: str,
+    rows_inserted: int | None,
+    result: dict[str, Any] | None = None,
+    error: object | None = None,
+) -> None:
+    """Record how the import of ``fingerprint`` ended. ``rows_inserted``
+    is ``None`` when it is unknown, e.g. after an unexpected error.
+    """
+    status = (
+        ImportRecordStatus.FAILED if error is not None else ImportRecordStatus.COMPLETED
+    )
+    await update_import(
+        fingerprint,
+        status=status,
+        rows_inserted=rows_inserted,
+        result=result,
+        error=error,
+    )
+
+
+async def fail_interrupted_imports(queued_jobs: Collection[UUID]) -> None:
+    """Fail the imports a restart left in progress, except those of
+    ``queued_jobs``, which are still going to run. They may have
+    inserted rows, so retrying them needs ``force``.
+    """
+    records = await ImportRecord.where(status=ImportRecordStatus.IN_PROGRESS).all()
+    for record in records:
+        if record.job_uid not in queued_jobs:
+            await record.update(
+                status=ImportRecordStatus.FAILED, rows_inserted=None, error=INTERRUPTED
+            )
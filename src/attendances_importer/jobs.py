@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import os
+import shutil
+from typing import BinaryIO
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from .config import Settings
+from .enums import ImportJobStatus, UserRole
+from .fingerprints import INTERRUPTED, fail_interrupted_imports, record_import
+from .models import ImportJob
+from .service import ImportProgress, import_file
+from .token import AuthenticatedUser
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FAILED = 'Import failed unexpectedly'
+
+queue: asyncio.Queue[UUID] = asyncio.Queue()
+workers: list[asyncio.Task[None]] = []
+running_jobs: dict[UUID, ImportProgress] = {}
+
+
+def save_upload(file: UploadFile, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    file.file.seek(0)
+    with open(path, 'wb') as destination:
+        shutil.copyfileobj(file.file, destination)
+
+
+def remove_upload(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+async def enqueue_import(
+    created_by: AuthenticatedUser,
+    file: UploadFile,
+    file_extension: str,
+    fingerprint: str | None = None,
+) -> ImportJob:
+    uid = uuid4()
+    file_path = os.path.join(Settings.IMPORT_JOBS_DIR, f'{uid}.{file_extension}')
+    await run_in_threadpool(save_upload, file, file_path)
+
+    job = await ImportJob.create(
+        uid=uid,
+        file_path=file_path,
+        file_extension=file_extension,
+        access_token=created_by.access_token,
+        fingerprint=fingerprint,
+        created_by=created_by.uid,
+    )
+    queue.put_nowait(job.uid)
+    return job
+
+
+async def read_import_job(read_by: AuthenticatedUser, uid: UUID):
+    job = await ImportJob.get(uid)
+    if not job:
+        return None
+
+    if read_by.role != UserRole.ADMIN and job.created_by != read_by.uid:
+        return None
+
+    progress = running_jobs.get(uid)
+    if progress:
+        job.rows_parsed = progress.parsed
+        job.rows_validated = progress.validated
+        job.rows_inserted = progress.inserted
+
+    return job
+
+
+async def run_import_job(uid: UUID) -> None:
+    job = await ImportJob.get(uid)
+    if not job or job.status != ImportJobStatus.QUEUED:
+        return
+
+    await job.update(status=ImportJobStatus.RUNNING)
+    progress = running_jobs[uid] = ImportProgress()
+    outcome: dict[str, object]
+    rows_inserted: int | None = None
+    file: BinaryIO | None = None
+    try:
+        file = await run_in_threadpool(open, job.file_path, 'rb')
+        response = await import_file(
+            job.access_token, file, job.file_extension, progress, collect=False
+        )
+        outcome = {
+            'status': ImportJobStatus.COMPLETED,
+            'result': response.model_dump(mode='json', exclude={'attendances'}),
+        }
+        rows_inserted = progress.inserted
+    except HTTPException as e:
+        outcome = {'status': ImportJobStatus.FAILED, 'error': e.detail}
+        rows_inserted = progress.inserted
+    except Exception:
+        logger.exception('Import job %s failed', uid)
+        outcome = {'status': ImportJobStatus.FAILED, 'error': IMPORT_FAILED}
+    finally:
+        running_jobs.pop(uid, None)
+        if file:
+            await run_in_threadpool(file.close)
+
+    # The token is only needed to forward the rows; do not keep it at rest.
+    await job.update(
+        **outcome,
+        access_token=None,
+        rows_parsed=progress.parsed,
+        rows_validated=progress.validated,
+        rows_inserted=progress.inserted,
+    )
+    if job.fingerprint:
+        await record_import(job.fingerprint, rows_inserted, job.result, job.error)
+    await run_in_threadpool(remove_upload, job.file_path)
+
+
+async def work() -> None:
+    while True:
+        uid = await queue.get()
+        try:
+            await run_import_job(uid)
+        except Exception:
+            logger.exception('Import job %s could not be completed', uid)
+        finally:
+            queue.task_done()
+
+
+async def start_import_workers() -> None:
+    """Requeue the jobs persisted before a restart and start the workers.
+
+    Jobs that were running when the process stopped may have inserted
+    part of their rows, so they are failed instead of being run again,
+    and so are the other imports left in progress.
+    """
+    interrupted = await ImportJob.where(status=ImportJobStatus.RUNNING).all()
+    for job in interrupted:
+        await job.update(
+            status=ImportJobStatus.FAILED,
+            error=INTERRUPTED,
+            access_token=None,
+        )
+
+    queued = ImportJob.where(status=ImportJobStatus.QUEUED).sort('created_at')
+    queued_jobs = [job.uid for job in await queued.all()]
+    await fail_interrupted_imports(queued_jobs)
+    for uid in queued_jobs:
+        queue.put_nowait(uid)
+
+    for _ in range(max(Settings.IMPORT_WORKERS, 1)):
+        workers.append(asyncio.create_task(work()))
+
+
+async def stop_import_workers() -> None:
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    workers.clear()
@@ -1,12 +1,45 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi_auth_middleware import AuthMiddleware
 
+from .database import create_connection
+from .health import readiness, wait_for_database, warm_up_pool
+from .health import router as health_router
+from .http_client import close_http_client, open_http_client
+from .jobs import start_import_workers, stop_import_workers
+from .metrics import MetricsMiddleware, instrument_engine
+from .metrics import router as metrics_router
+from .models import BaseModel
+from .process_pool import close_process_pool, open_process_pool
 from .routes import router
 from .token import verify_authorization_header
 
-app = FastAPI(title='Attendances Importer Service')
+conn = create_connection()
+instrument_engine(conn.async_engine)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    readiness.starting(conn.async_engine)
+    await wait_for_database(conn.async_engine)
+    await conn.init_db(BaseModel)
+    await warm_up_pool(conn.async_engine)
+    open_http_client()
+    open_process_pool()
+    await start_import_workers()
+    readiness.mark_ready()
+    yield
+    readiness.mark_stopping()
+    await stop_import_workers()
+    close_process_pool()
+    await close_http_client()
+    await conn.close(BaseModel)
+
+
+app = FastAPI(title='Attendances Importer Service', lifespan=lifespan)
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=['*'])
 app.add_middleware(
     CORSMiddleware,
@@ -15,6 +48,9 @@ app.add_middleware(
     allow_headers=['*'],
 )
 app.add_middleware(AuthMiddleware, verify_header=verify_authorization_header)  # type: ignore
+app.add_middleware(MetricsMiddleware)
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(router)
 
 if __name__ == '__main__':
@@ -0,0 +1,48 @@
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from sqlactive import ActiveRecordBaseModel
+from sqlalchemy import JSON, Enum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .enums import ImportJobStatus, ImportRecordStatus
+
+
+class BaseModel(ActiveRecordBaseModel):
+    __abstract__ = True
+
+
+class ImportJob(BaseModel):
+    __tablename__ = 'import_jobs'
+
+    uid: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    status: Mapped[ImportJobStatus] = mapped_column(
+        Enum(ImportJobStatus, name='import_job_status'),
+        default=ImportJobStatus.QUEUED,
+    )
+    file_path: Mapped[str] = mapped_column()
+    file_extension: Mapped[str] = mapped_column()
+    access_token: Mapped[Optional[str]] = mapped_column(nullable=True)
+    rows_parsed: Mapped[int] = mapped_column(default=0)
+    rows_validated: Mapped[int] = mapped_column(default=0)
+    rows_inserted: Mapped[int] = mapped_column(default=0)
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    fingerprint: Mapped[Optional[str]] = mapped_column(nullable=True)
+    created_by: Mapped[UUID] = mapped_column()
+
+
+class ImportRecord(BaseModel):
+    __tablename__ = 'import_records'
+
+    fingerprint: Mapped[str] = mapped_column(primary_key=True)
+    status: Mapped[ImportRecordStatus] = mapped_column(
+        Enum(ImportRecordStatus, name='import_record_status'),
+        default=ImportRecordStatus.IN_PROGRESS,
+    )
+    file_extension: Mapped[str] = mapped_column()
+    rows_inserted: Mapped[Optional[int]] = mapped_column(nullable=True, default=0)
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    job_uid: Mapped[Optional[UUID]] = mapped_column(nullable=True)
+    created_by: Mapped[UUID] = mapped_column()
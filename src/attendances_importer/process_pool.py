@@ -0,0 +1,58 @@
+import multiprocessing
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.managers import SyncManager
+
+from .config import Settings
+
+_executor: ProcessPoolExecutor | None = None
+_manager: SyncManager | None = None
+
+
+def limit_memory(limit_mb: int) -> None:
+    if limit_mb > 0:
+        limit = limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def open_process_pool() -> None:
+    global _executor, _manager
+
+    if Settings.IMPORT_PROCESSES <= 0 or _executor is not None:
+        return
+
+    # spawn keeps the workers free of the event loop and threads of the
+    # parent, which fork would copy in an undefined state.
+    context = multiprocessing.get_context('spawn')
+    _manager = context.Manager()
+    _executor = ProcessPoolExecutor(
+        max_workers=Settings.IMPORT_PROCESSES,
+        mp_context=context,
+        initializer=limit_memory,
+        initargs=(Settings.IMPORT_PROCESS_MEMORY_LIMIT,),
+    )
+
+
+def close_process_pool() -> None:
+    global _executor, _manager
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+    if _manager is not None:
+        _manager.shutdown()
+        _manager = None
+
+
+def reset_process_pool() -> None:
+    """Replace a pool broken by a worker that died abruptly."""
+    close_process_pool()
+    open_process_pool()
+
+
+def get_process_pool() -> tuple[ProcessPoolExecutor, SyncManager] | None:
+    if _executor is None or _manager is None:
+        return None
+
+    return _executor, _manager
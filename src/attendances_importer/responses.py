@@ -0,0 +1,29 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class FinalizedStreamingResponse(StreamingResponse):
+    """A ``StreamingResponse`` that awaits ``finalize`` once it is done,
+    however it ended.
+
+    A generator only runs its cleanup if it was started, so the body
+    alone cannot tell when a client left before the response began.
+    ``finalize`` is shielded from the cancellation of a disconnect.
+    """
+
+    def __init__(
+        self, content: Any, finalize: Callable[[], Awaitable[None]], **kwargs: Any
+    ) -> None:
+        super().__init__(content, **kwargs)
+        self.finalize = finalize
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.finalize()
@@ -1,24 +1,199 @@
-from fastapi import APIRouter, UploadFile
+import logging
+from uuid import UUID
+
+import anyio
+from fastapi import APIRouter, HTTPException, UploadFile, status
 from starlette.authentication import requires
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from .dtos import (
+    AttendanceImportSummary,
+    HTTPPoolStats,
+    ImportJobResponse,
+    ImportRecordResponse,
+)
+from .enums import ImportRecordStatus, ImportResponseMode, UserRole
+from .errors import ImportInProgress, ImportJobNotFound, InvalidExtension, NoFilename
+from .fingerprints import (
+    claim_import,
+    fingerprint_upload,
+    record_import,
+    update_import,
+)
+from .http_client import http_pool_stats
+from .jobs import IMPORT_FAILED, enqueue_import, read_import_job
+from .models import ImportRecord
+from .responses import FinalizedStreamingResponse
+from .service import (
+    ImportProgress,
+    from_csv,
+    from_excel,
+    import_summary,
+    stream_import,
+)
+from .token import AuthenticatedUser
 
-from .enums import UserRole
-from .errors import InvalidExtension, NoFilename
-from .service import from_csv, from_excel
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
 @router.post('/attendances/import', tags=['attendances'])
 @requires(UserRole.ATTENDANCE_OFFICER)
-async def read_file(request: Request, file: UploadFile):
+async def read_file(
+    request: Request,
+    file: UploadFile,
+    job: bool = False,
+    response: ImportResponseMode = ImportResponseMode.FULL,
+    force: bool = False,
+):
     if not file.filename:
         raise NoFilename
 
     if file.filename.endswith('.csv'):
-        return await from_csv(request.user.access_token, file)
+        file_extension = 'csv'
+    elif file.filename.endswith('.xlsx'):
+        file_extension = 'xlsx'
+    else:
+        raise InvalidExtension
+
+    # Retried uploads of a file that is being imported, or that already
+    # inserted rows, get the earlier import back instead of being parsed
+    # and inserted again.
+    fingerprint = await run_in_threadpool(
+        fingerprint_upload, file.file, request.user.company_id
+    )
+    previous = await claim_import(fingerprint, request.user.uid, file_extension, force)
+    if previous:
+        return await previous_import_response(request.user, previous)
+
+    recorded = False
+
+    async def remember_summary(summary: AttendanceImportSummary | None) -> None:
+        nonlocal recorded
+        if recorded:
+            return
+
+        recorded = True
+        # Shielded, so that a cancellation cannot leave it in progress.
+        with anyio.CancelScope(shield=True):
+            if summary is None:
+                await record_import(fingerprint, None, error='Import was interrupted')
+            else:
+                await record_import(
+                    fingerprint,
+                    summary.inserted,
+                    summary.model_dump(mode='json'),
+                    summary.error,
+                )
+
+    if job:
+        try:
+            import_job = await enqueue_import(
+                request.user, file, file_extension, fingerprint
+            )
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await record_import(fingerprint, 0, error='Import could not be queued')
+            raise
+
+        await update_import(fingerprint, job_uid=import_job.uid)
+        return JSONResponse(
+            ImportJobResponse.model_validate(import_job).model_dump(mode='json'),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    progress = ImportProgress()
+    try:
+        if response == ImportResponseMode.NDJSON:
+            # The import only reports back if the body is iterated, so an
+            # import the client left before is recorded as interrupted.
+            return FinalizedStreamingResponse(
+                stream_import(
+                    request.user.access_token,
+                    file.file,
+                    file_extension,
+                    remember_summary,
+                ),
+                lambda: remember_summary(None),
+                media_type='application/x-ndjson',
+            )
+
+        if response == ImportResponseMode.SUMMARY:
+            summary, status_code = await import_summary(
+                request.user.access_token, file.file, file_extension
+            )
+            await remember_summary(summary)
+            return JSONResponse(
+                summary.model_dump(mode='json'), status_code=status_code
+            )
+
+        if file_extension == 'csv':
+            imported = await from_csv(request.user.access_token, file, progress)
+        else:
+            imported = await from_excel(request.user.access_token, file, progress)
+    except HTTPException as e:
+        await record_import(fingerprint, progress.inserted, error=e.detail)
+        raise
+    except Exception:
+        # Chunks in flight may have been inserted, so the count is unknown.
+        logger.exception('Import of %s failed', fingerprint)
+        await record_import(fingerprint, None, error=IMPORT_FAILED)
+        raise
+    except BaseException:
+        # Cancelled, e.g. on shutdown or when the client disconnected.
+        await remember_summary(None)
+        raise
+
+    await record_import(
+        fingerprint,
+        imported.inserted,
+        imported.model_dump(mode='json', exclude={'attendances'}),
+    )
+    return imported
+
+
+async def previous_import_response(user: AuthenticatedUser, previous: ImportRecord):
+    """Answer a duplicate upload with the job still importing the file, a
+    409 while it is imported by another request or after a failure that
+    inserted rows, or the result of the completed import.
+    """
+    if previous.status == ImportRecordStatus.IN_PROGRESS:
+        import_job = previous.job_uid and await read_import_job(user, previous.job_uid)
+        if not import_job:
+            raise ImportInProgress
+
+        return JSONResponse(
+            ImportJobResponse.model_validate(import_job).model_dump(mode='json'),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+    record = ImportRecordResponse.model_validate(previous)
+    if previous.status == ImportRecordStatus.FAILED:
+        return JSONResponse(
+            record.model_dump(mode='json'), status_code=status.HTTP_409_CONFLICT
+        )
+
+    return record
+
+
+@router.get(
+    '/attendances/import/{job_id:uuid}',
+    response_model=ImportJobResponse,
+    tags=['attendances'],
+)
+@requires(UserRole.ATTENDANCE_OFFICER)
+async def get_import_job(request: Request, job_id: UUID):
+    import_job = await read_import_job(request.user, job_id)
+    if not import_job:
+        raise ImportJobNotFound
+
+    return ImportJobResponse.model_validate(import_job)
 
-    if file.filename.endswith('.xlsx'):
-        return await from_excel(request.user.access_token, file)
 
-    raise InvalidExtension
+@router.get('/http-pool/stats', response_model=HTTPPoolStats, tags=['internal'])
+@requires(UserRole.ADMIN)
+async def get_http_pool_stats(request: Request):
+    return HTTPPoolStats(**http_pool_stats())
@@ -1,17 +1,58 @@
+import asyncio
 import csv
 import json
-from io import BytesIO, StringIO
-from typing import Any
+import logging
+import os
+import shutil
+import signal
+import tempfile
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, suppress
+from io import TextIOWrapper
+from itertools import islice
+from queue import Empty, Full, Queue
+from threading import Event
+from time import monotonic, perf_counter
+from typing import IO, Any
+from zipfile import BadZipFile
 
-import httpx
 import orjson
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException, UploadFile, status
 from openpyxl import load_workbook
-from pydantic import ValidationError
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from .config import Settings
-from .dtos import AttendanceCreate, AttendanceCreateMultiple, AttendanceImportResponse
-from .errors import NoActiveSheet, RowValidationError
+from .dtos import (
+    AttendanceCreate,
+    AttendanceCreateMultiple,
+    AttendanceImportResponse,
+    AttendanceImportSummary,
+    ImportChunkResult,
+)
+from .errors import (
+    ImportInterrupted,
+    InvalidEncoding,
+    NoActiveSheet,
+    ParseFailed,
+    ParseTimeout,
+    RowValidationError,
+    UnreadableFile,
+)
+from .http_client import get_http_client
+from .metrics import IMPORT_ROWS
+from .process_pool import get_process_pool, reset_process_pool
+
+logger = logging.getLogger(__name__)
 
 BASE_FIELDS = [
     'full_name',
@@ -24,12 +65,52 @@ BASE_FIELDS = [
 ]
 
 
-def read_attendances(reader):
-    headers = next(reader)
+ChunkCallback = Callable[
+    [int, list[AttendanceCreate], BaseException | None], Awaitable[None]
+]
+
+
+class RowCounts:
+    """Row counts of one pass over a file."""
+
+    def __init__(self) -> None:
+        self.parsed = 0
+        self.validated = 0
+        self.inserted = 0
+
+
+class ImportProgress(RowCounts):
+    """Row counts of an import. Their increases are also added to the
+    ``import_rows_total`` counter, whose rate gives the rows per second.
+    """
+
+    def __setattr__(self, name: str, value: int) -> None:
+        increase = value - getattr(self, name, 0)
+        super().__setattr__(name, value)
+        if increase > 0:
+            IMPORT_ROWS.labels(name).inc(increase)
+
+
+attendances_adapter = TypeAdapter(list[AttendanceCreate])
+
+
+def iter_row_batches(
+    reader: Iterable[Sequence[Any]], progress: RowCounts
+) -> Iterator[tuple[list[int], list[dict[str, Any]]]]:
+    """Group the non-empty rows of ``reader`` into batches of dicts,
+    alongside their row numbers in the file.
+
+    Batches are kept small (``IMPORT_VALIDATION_BATCH_SIZE``): holding
+    thousands of fresh dicts and models alive at once makes the cyclic
+    garbage collector cost more than batching saves.
+    """
+    rows = iter(reader)
+    headers = next(rows, [])
     additional_keys = headers[len(BASE_FIELDS) :]
-    attendance_list = []
 
-    for i, row in enumerate(reader):
+    numbers: list[int] = []
+    batch: list[dict[str, Any]] = []
+    for i, row in enumerate(rows):
         if i >= Settings.MAX_ROWS:
             break
 
@@ -43,72 +124,610 @@ def read_attendances(reader):
             dict(zip(additional_keys, additional_values)) if additional_keys else None
         )
         base_data['additional_data'] = additional_data
+        progress.parsed += 1
 
-        try:
-            attendance_list.append(AttendanceCreate(**base_data))
-        except ValidationError as e:
-            msg = e.errors()[0]['msg']
-            loc = e.errors()[0]['loc']
-            raise RowValidationError(i + 2, f'{loc[-1]} - {msg}')
+        numbers.append(i + 2)
+        batch.append(base_data)
+        if len(batch) >= Settings.IMPORT_VALIDATION_BATCH_SIZE:
+            yield numbers, batch
+            numbers, batch = [], []
+
+    if batch:
+        yield numbers, batch
+
+
+def validate_rows(
+    numbers: list[int], batch: list[dict[str, Any]]
+) -> tuple[list[AttendanceCreate], list[dict[str, object]]]:
+    """Validate a whole batch in a single call to pydantic-core, which
+    reports the errors of every row instead of stopping at the first.
+    """
+    try:
+        return attendances_adapter.validate_python(batch), []
+    except ValidationError as e:
+        errors = [
+            {
+                'row': numbers[error['loc'][0]],
+                'field': '.'.join(str(part) for part in error['loc'][1:]),
+                'message': error['msg'],
+            }
+            for error in e.errors(include_url=False)
+        ]
+        return [], errors
+
+
+def iter_attendances(
+    reader: Iterable[Sequence[Any]], progress: RowCounts | None = None
+) -> Iterator[AttendanceCreate]:
+    """Yield the validated rows of ``reader``.
+
+    Once a row fails, nothing else is yielded, but the rest of the file
+    is still validated so that ``RowValidationError`` lists every error,
+    up to ``IMPORT_MAX_ROW_ERRORS``.
+    """
+    progress = progress or ImportProgress()
+    errors: list[dict[str, object]] = []
+
+    for numbers, batch in iter_row_batches(reader, progress):
+        attendances, batch_errors = validate_rows(numbers, batch)
+        errors.extend(batch_errors)
+        if len(errors) >= Settings.IMPORT_MAX_ROW_ERRORS:
+            break
+        if errors:
+            continue
+
+        progress.validated += len(attendances)
+        yield from attendances
+
+    if errors:
+        raise RowValidationError(errors[: Settings.IMPORT_MAX_ROW_ERRORS])
+
+
+def read_attendances(reader: Iterable[Sequence[Any]]) -> list[AttendanceCreate]:
+    return list(iter_attendances(reader))
+
+
+def iter_attendances_from_excel(
+    file: UploadFile, progress: RowCounts | None = None
+) -> Iterator[AttendanceCreate]:
+    """Stream rows straight off the spooled upload with openpyxl's
+    read-only worksheets, which parse the sheet lazily instead of
+    building every cell object up front.
+    """
+    file.file.seek(0)
+    try:
+        wb = load_workbook(filename=file.file, read_only=True)
+    except (BadZipFile, InvalidFileException, KeyError):
+        raise UnreadableFile('xlsx')
 
-    return attendance_list
+    try:
+        sheet = wb.active
+        if not sheet:
+            raise NoActiveSheet
+
+        reader = sheet.iter_rows(values_only=True, max_row=Settings.MAX_ROWS)
+        yield from iter_attendances(reader, progress)
+    except BadZipFile:
+        # Sheet members are only checked as they are read.
+        raise UnreadableFile('xlsx')
+    finally:
+        wb.close()
 
 
 def read_attendances_from_excel(file: UploadFile):
-    contents = file.file.read()
-    wb = load_workbook(filename=BytesIO(contents))
-    sheet = wb.active
-    if not sheet:
-        raise NoActiveSheet
+    return list(iter_attendances_from_excel(file))
+
 
-    reader = sheet.iter_rows(values_only=True, max_row=Settings.MAX_ROWS)
-    return read_attendances(reader)
+def iter_attendances_from_csv(
+    file: UploadFile, progress: RowCounts | None = None
+) -> Iterator[AttendanceCreate]:
+    """Decode and parse the spooled upload incrementally, block by block,
+    instead of loading the whole file as bytes and then as text.
+    """
+    file.file.seek(0)
+    stream = TextIOWrapper(file.file, encoding='utf-8', newline='')
+    try:
+        yield from iter_attendances(csv.reader(stream), progress)
+    except UnicodeDecodeError:
+        raise InvalidEncoding
+    except csv.Error:
+        raise UnreadableFile('csv')
+    finally:
+        # Leave the upload open; FastAPI closes it after the request.
+        stream.detach()
 
 
 def read_attendances_from_csv(file: UploadFile):
-    contents = file.file.read().decode('utf-8')
-    reader = csv.reader(StringIO(contents))
-    return read_attendances(reader)
+    return list(iter_attendances_from_csv(file))
 
 
 async def create_attendances(access_token: str, attendances: list[AttendanceCreate]):
     content = orjson.dumps(
         AttendanceCreateMultiple(attendances=attendances).model_dump()
     )
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f'{Settings.ATTENDANCES_URL}/attendances/multiple',
-            headers={'Authorization': 'Bearer ' + access_token},
-            content=content,
+    response = await get_http_client().post(
+        f'{Settings.ATTENDANCES_URL}/attendances/multiple',
+        headers={
+            'Authorization': 'Bearer ' + access_token,
+            'Content-Type': 'application/json',
+        },
+        content=content,
+    )
+    if response.is_error:
+        try:
+            detail = response.json()['detail']
+        except (json.decoder.JSONDecodeError, KeyError):
+            detail = response.text
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=detail,
         )
-        if response.is_error:
+
+    return response
+
+
+def next_chunk(attendances: Iterator[AttendanceCreate]) -> list[AttendanceCreate]:
+    return list(islice(attendances, Settings.IMPORT_CHUNK_SIZE))
+
+
+def iter_attendances_from_file(
+    file: IO[bytes], file_extension: str, progress: RowCounts
+) -> Iterator[AttendanceCreate]:
+    if file_extension == 'xlsx':
+        return iter_attendances_from_excel(UploadFile(file), progress)
+
+    return iter_attendances_from_csv(UploadFile(file), progress)
+
+
+def validate_file(
+    file: IO[bytes],
+    file_extension: str,
+    progress: RowCounts,
+    on_chunk: Callable[[], bool] | None = None,
+) -> bool:
+    """Parse and validate the whole file without keeping its rows, raising
+    ``RowValidationError`` with every row error found.
+
+    ``on_chunk`` is called after each chunk of valid rows; when it
+    returns ``False`` the pass stops early and ``False`` is returned.
+    """
+    attendances = iter_attendances_from_file(file, file_extension, progress)
+    with closing(attendances):
+        while next_chunk(attendances):
+            if on_chunk and not on_chunk():
+                return False
+
+    return True
+
+
+def raise_parse_timeout(signum: int, frame: Any) -> None:
+    raise ParseTimeout
+
+
+def put_chunk(queue: Queue, item: tuple[Any, ...], cancelled: Event) -> bool:
+    # The parse timer is paused so that it cannot interrupt a put half
+    # way through, and the time blocked on a full queue is not counted.
+    remaining, interval = signal.setitimer(signal.ITIMER_PROF, 0)
+    try:
+        while not cancelled.is_set():
             try:
-                detail = response.json()['detail']
-            except (json.decoder.JSONDecodeError, KeyError):
-                detail = response.text
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=detail,
-            )
+                queue.put(item, timeout=0.5)
+                return True
+            except Full:
+                continue
 
-        return response
+        return False
+    finally:
+        if remaining:
+            signal.setitimer(signal.ITIMER_PROF, remaining, interval)
 
 
-async def from_excel(access_token: str, file: UploadFile):
-    attendances = read_attendances_from_excel(file)
-    response = await create_attendances(access_token, attendances)
-    return AttendanceImportResponse(
-        attendances=attendances,
-        insertion_response=response.json(),
-        file_extension='xlsx',
+def parse_file(
+    path: str, file_extension: str, queue: Queue, cancelled: Event, timeout: float
+) -> None:
+    """Parse and validate ``path`` inside a pool worker, streaming the
+    validated chunks back through ``queue`` once the whole file is valid.
+
+    Each item is ``(chunk, parsed, validated, error)``; a ``None`` chunk
+    only reports progress, the first one as soon as the worker starts,
+    and an empty chunk marks the end of the file.
+
+    After ``timeout`` seconds of CPU time the worker raises
+    ``ParseTimeout`` itself, so a file stuck in ``load_workbook`` or on a
+    huge row frees its pool worker instead of holding it until it ends.
+    The timer fires again every second in case the first is swallowed.
+    """
+    progress = RowCounts()
+    error = None
+    signal.signal(signal.SIGPROF, raise_parse_timeout)
+    signal.setitimer(signal.ITIMER_PROF, timeout, 1.0)
+    try:
+        parse_into_queue(path, file_extension, queue, cancelled, progress)
+    except HTTPException as e:
+        error = (e.status_code, e.detail)
+    except MemoryError:
+        error = (
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            'File is too large to parse',
+        )
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+
+    if error:
+        put_chunk(queue, ([], progress.parsed, progress.validated, error), cancelled)
+
+
+def parse_into_queue(
+    path: str,
+    file_extension: str,
+    queue: Queue,
+    cancelled: Event,
+    progress: RowCounts,
+) -> None:
+
+    def report() -> bool:
+        item = (None, progress.parsed, progress.validated, None)
+        return put_chunk(queue, item, cancelled)
+
+    if not report():
+        return
+
+    with open(path, 'rb') as file:
+        if not validate_file(file, file_extension, progress, report):
+            return
+
+        attendances = iter_attendances_from_file(file, file_extension, RowCounts())
+        with closing(attendances):
+            while chunk := next_chunk(attendances):
+                item = (chunk, progress.parsed, progress.validated, None)
+                if not put_chunk(queue, item, cancelled):
+                    return
+
+    put_chunk(queue, ([], progress.parsed, progress.validated, None), cancelled)
+
+
+async def iter_chunks_in_thread(
+    attendances: Iterator[AttendanceCreate],
+) -> AsyncIterator[list[AttendanceCreate]]:
+    try:
+        while chunk := await run_in_threadpool(next_chunk, attendances):
+            yield chunk
+    finally:
+        close = getattr(attendances, 'close', None)
+        if close:
+            close()
+
+
+async def iter_chunks_in_process(
+    path: str, file_extension: str, progress: ImportProgress
+) -> AsyncIterator[list[AttendanceCreate]]:
+    pool = get_process_pool()
+    assert pool is not None
+    executor, manager = pool
+
+    queue = manager.Queue(maxsize=Settings.IMPORT_MAX_CONCURRENCY)
+    cancelled = manager.Event()
+    future = executor.submit(
+        parse_file,
+        path,
+        file_extension,
+        queue,
+        cancelled,
+        Settings.IMPORT_PARSE_TIMEOUT,
     )
+    # Only the time spent waiting on the parser counts towards the
+    # timeout: not the wait for a free pool worker, which ends with the
+    # first item, nor the time a chunk is held while it is forwarded.
+    remaining = Settings.IMPORT_PARSE_TIMEOUT
+    started = False
+    try:
+        while True:
+            if remaining <= 0:
+                raise ParseTimeout
+
+            waiting = monotonic()
+            try:
+                chunk, parsed, validated, error = await run_in_threadpool(
+                    queue.get, timeout=min(remaining, 1.0)
+                )
+            except Empty:
+                if future.done() and queue.empty():
+                    try:
+                        future.result()
+                    except HTTPException:
+                        raise
+                    except BrokenProcessPool:
+                        reset_process_pool()
+                    except Exception:
+                        logger.exception('Parsing of %s failed', path)
+                    raise ParseFailed
+                continue
+            finally:
+                if started:
+                    remaining -= monotonic() - waiting
+
+            started = True
+
+            progress.parsed = parsed
+            progress.validated = validated
+            if error:
+                raise HTTPException(status_code=error[0], detail=error[1])
+            if chunk is None:
+                continue
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        cancelled.set()
+
+
+def spill_to_disk(file: IO[bytes]) -> str:
+    file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False) as destination:
+        shutil.copyfileobj(file, destination)
+        return destination.name
 
 
-async def from_csv(access_token: str, file: UploadFile):
-    attendances = read_attendances_from_csv(file)
-    response = await create_attendances(access_token, attendances)
+async def send_chunk(
+    access_token: str, index: int, chunk: list[AttendanceCreate]
+) -> ImportChunkResult:
+    response = await create_attendances(access_token, chunk)
+    return ImportChunkResult(index=index, rows=len(chunk), response=response.json())
+
+
+async def import_attendances(
+    access_token: str,
+    chunks: AsyncIterator[list[AttendanceCreate]],
+    file_extension: str,
+    progress: ImportProgress | None = None,
+    collect: bool = True,
+    on_chunk: ChunkCallback | None = None,
+):
+    """Forward rows to the attendances service in chunks while the file
+    is still being parsed.
+
+    ``chunks`` must only yield rows of a file that was already validated
+    in full, so that no chunk is forwarded before a row error. Parsing
+    runs outside the event loop so it overlaps with the requests
+    in flight, and no more chunks are pulled while
+    ``IMPORT_MAX_CONCURRENCY`` requests are pending. The first failure
+    stops the import once the pending chunks have settled.
+
+    The imported rows are only kept for the response when ``collect`` is
+    set; ``on_chunk`` is awaited with the outcome of every chunk.
+    """
+    imported: list[AttendanceCreate] = []
+    results: list[ImportChunkResult] = []
+    pending: dict[asyncio.Task[ImportChunkResult], int] = {}
+    sent: dict[int, list[AttendanceCreate]] = {}
+    error: BaseException | None = None
+
+    async def settle(return_when: str) -> None:
+        nonlocal error
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            index = pending.pop(task)
+            failure = task.exception()
+            if failure is None:
+                result = task.result()
+                results.append(result)
+                if progress:
+                    progress.inserted += result.rows
+            else:
+                error = error or failure
+            if on_chunk:
+                await on_chunk(index, sent.pop(index), failure)
+
+    try:
+        index = 0
+        while error is None:
+            if len(pending) >= Settings.IMPORT_MAX_CONCURRENCY:
+                await settle(asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                chunk = await anext(chunks, [])
+            except HTTPException as e:
+                error = e
+                break
+
+            if not chunk:
+                break
+
+            if collect:
+                imported.extend(chunk)
+            if on_chunk:
+                sent[index] = chunk
+            pending[asyncio.create_task(send_chunk(access_token, index, chunk))] = index
+            index += 1
+
+        if pending:
+            await settle(asyncio.ALL_COMPLETED)
+    finally:
+        await chunks.aclose()
+
+    results.sort(key=lambda result: result.index)
+    inserted = sum(result.rows for result in results)
+    if error is not None:
+        if not inserted:
+            raise error
+        raise ImportInterrupted(
+            getattr(error, 'status_code', status.HTTP_502_BAD_GATEWAY),
+            getattr(error, 'detail', str(error)),
+            inserted,
+        )
+
     return AttendanceImportResponse(
-        attendances=attendances,
-        insertion_response=response.json(),
-        file_extension='csv',
+        attendances=imported,
+        insertion_response=results[-1].response if results else {},
+        file_extension=file_extension,
+        inserted=inserted,
+        chunks=results,
     )
+
+
+async def import_file(
+    access_token: str,
+    file: IO[bytes],
+    file_extension: str,
+    progress: ImportProgress | None = None,
+    collect: bool = True,
+    on_chunk: ChunkCallback | None = None,
+):
+    """Import ``file``, parsing it in the process pool when one is
+    configured and in a worker thread otherwise.
+
+    The file is read twice: a first pass validates every row, and only
+    when it passes is the file parsed again while its chunks are
+    forwarded. A row error therefore leaves nothing inserted.
+    """
+    progress = progress or ImportProgress()
+    if get_process_pool() is None:
+        try:
+            await run_in_threadpool(validate_file, file, file_extension, progress)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception('Parsing of the upload failed')
+            raise ParseFailed from e
+        attendances = iter_attendances_from_file(file, file_extension, RowCounts())
+        return await import_attendances(
+            access_token,
+            iter_chunks_in_thread(attendances),
+            file_extension,
+            progress,
+            collect,
+            on_chunk,
+        )
+
+    # Pool workers read the upload by path, so in-memory or unnamed
+    # spooled uploads are written to a temporary file first.
+    path = getattr(file, 'name', None)
+    spilled = None
+    if not isinstance(path, str) or not os.path.isfile(path):
+        path = spilled = await run_in_threadpool(spill_to_disk, file)
+
+    try:
+        return await import_attendances(
+            access_token,
+            iter_chunks_in_process(path, file_extension, progress),
+            file_extension,
+            progress,
+            collect,
+            on_chunk,
+        )
+    finally:
+        if spilled:
+            os.remove(spilled)
+
+
+async def import_summary(
+    access_token: str,
+    file: IO[bytes],
+    file_extension: str,
+    on_chunk: ChunkCallback | None = None,
+) -> tuple[AttendanceImportSummary, int]:
+    """Import ``file`` without keeping the imported rows, returning only
+    the counts, the elapsed time and the error, if any, together with
+    the status code of the outcome.
+    """
+    progress = ImportProgress()
+    started = perf_counter()
+    status_code = status.HTTP_200_OK
+    error = None
+    try:
+        await import_file(access_token, file, file_extension, progress, False, on_chunk)
+    except HTTPException as e:
+        status_code, error = e.status_code, e.detail
+
+    summary = AttendanceImportSummary(
+        file_extension=file_extension,
+        parsed=progress.parsed,
+        validated=progress.validated,
+        inserted=progress.inserted,
+        elapsed=round(perf_counter() - started, 3),
+        error=error,
+    )
+    return summary, status_code
+
+
+async def stream_import(
+    access_token: str,
+    file: IO[bytes],
+    file_extension: str,
+    on_complete: Callable[[AttendanceImportSummary | None], Awaitable[None]]
+    | None = None,
+) -> AsyncIterator[bytes]:
+    """Import ``file`` while streaming one NDJSON line per forwarded row,
+    as each chunk settles, followed by a ``summary`` line.
+    ``on_complete`` is awaited with the summary once the import ends, or
+    with ``None`` if it was cancelled, e.g. by the client disconnecting.
+
+    Rows are numbered by their position among the imported rows. Lines
+    go through a bounded queue, so a slow client slows the import down
+    instead of piling the outcomes up in memory.
+    """
+    lines: asyncio.Queue[bytes | None] = asyncio.Queue(
+        maxsize=Settings.IMPORT_MAX_CONCURRENCY
+    )
+
+    async def on_chunk(
+        index: int, chunk: list[AttendanceCreate], failure: BaseException | None
+    ) -> None:
+        first = index * Settings.IMPORT_CHUNK_SIZE
+        outcome = 'inserted' if failure is None else 'failed'
+        await lines.put(
+            b''.join(
+                orjson.dumps(
+                    {'index': first + i, 'document': row.document, 'status': outcome}
+                )
+                + b'\n'
+                for i, row in enumerate(chunk)
+            )
+        )
+
+    async def run() -> None:
+        summary = None
+        cancelled = False
+        try:
+            summary, _ = await import_summary(
+                access_token, file, file_extension, on_chunk
+            )
+            if on_complete:
+                await on_complete(summary)
+            await lines.put(
+                orjson.dumps({'summary': summary.model_dump(mode='json')}) + b'\n'
+            )
+        except BaseException as e:
+            cancelled = isinstance(e, asyncio.CancelledError)
+            if on_complete and summary is None:
+                await on_complete(None)
+            raise
+        finally:
+            # Once cancelled, nobody reads the queue any more and the
+            # sentinel could wait forever for a free slot.
+            if not cancelled:
+                await lines.put(None)
+
+    task = asyncio.create_task(run())
+    try:
+        while (line := await lines.get()) is not None:
+            yield line
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+async def from_excel(
+    access_token: str, file: UploadFile, progress: ImportProgress | None = None
+):
+    return await import_file(access_token, file.file, 'xlsx', progress)
+
+
+async def from_csv(
+    access_token: str, file: UploadFile, progress: ImportProgress | None = None
+):
+    return await import_file(access_token, file.file, 'csv', progress)
@@ -0,0 +1,81 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class AsyncTTLCache(Generic[T]):
+    """Bounded in-process LRU cache whose concurrent misses for the same
+    key share a single call to the loader.
+
+    ``ttl_for`` picks the time to live of each loaded value; returning
+    ``0`` leaves the value uncached. A ``max_size`` of ``0`` disables the
+    cache.
+    """
+
+    def __init__(self, ttl_for: Callable[[T], float], max_size: int) -> None:
+        self.ttl_for = ttl_for
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry and entry[0] > monotonic():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, load))
+            task.add_done_callback(lambda done: self._done(key, done))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+
+        # Shielded so a cancelled caller does not cancel the shared load.
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key``, including a load still in flight, whose result
+        may predate the change that caused the invalidation.
+        """
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        value = await load()
+        if self._inflight.get(key) is not asyncio.current_task():
+            return value
+
+        ttl = self.ttl_for(value)
+        if ttl > 0 and self.max_size > 0:
+            self._entries[key] = (monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.pop(key, None)
+        return value
+
+    def _done(self, key: Hashable, task: asyncio.Future[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            task.exception()
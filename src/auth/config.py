@@ -15,3 +15,23 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES = config(
         'ACCESS_TOKEN_EXPIRE_MINUTES', cast=int, default=30
     )
+    TOKEN_CACHE_SIZE = config('TOKEN_CACHE_SIZE', cast=int, default=1024)
+    ARGON2_TIME_COST = config('ARGON2_TIME_COST', cast=int, default=3)
+    ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', cast=int, default=65536)
+    ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', cast=int, default=4)
+    PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', cast=int, default=0)
+    USER_CACHE_SIZE = config('USER_CACHE_SIZE', cast=int, default=10000)
+    USER_CACHE_TTL = config('USER_CACHE_TTL', cast=float, default=60.0)
+    USER_CACHE_NEGATIVE_TTL = config(
+        'USER_CACHE_NEGATIVE_TTL', cast=float, default=10.0
+    )
+    STARTUP_TIMEOUT = config('STARTUP_TIMEOUT', cast=float, default=60.0)
+    STARTUP_RETRY_DELAY = config('STARTUP_RETRY_DELAY', cast=float, default=0.1)
+    STARTUP_RETRY_MAX_DELAY = config('STARTUP_RETRY_MAX_DELAY', cast=float, default=2.0)
+    DB_POOL_SIZE = config('DB_POOL_SIZE', cast=int, default=5)
+    DB_MAX_OVERFLOW = config('DB_MAX_OVERFLOW', cast=int, default=10)
+    SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+    SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default='5000')
+    SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default='-16000')
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default='134217728')
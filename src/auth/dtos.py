@@ -33,3 +33,14 @@ class UserResponse(BaseModel):
     company_id: UUID | None = None
     created_by: UUID | None = None
     updated_by: UUID | None = None
+
+
+class UserCacheInvalidation(BaseModel):
+    usernames: list[str]
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
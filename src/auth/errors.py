@@ -10,6 +10,14 @@ class Unauthorized(HTTPException):
         )
 
 
+class Forbidden(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='You do not have permissions to perform this action',
+        )
+
+
 class UserNotFound(HTTPException):
     def __init__(self) -> None:
         super().__init__(
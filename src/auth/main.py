@@ -1,23 +1,35 @@
-import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from sqlactive import DBConnection
-
-from .config import Settings
-from .models import BaseModel
+from sqlalchemy import select
+
+from .database import create_connection
+from .health import readiness, wait_for_database, warm_up_pool
+from .health import router as health_router
+from .metrics import MetricsMiddleware, instrument_engine
+from .metrics import router as metrics_router
+from .models import BaseModel, User
+from .passwords import close_password_pool, open_password_pool
 from .routes import router
 
-conn = DBConnection(str(Settings.DATABASE_URL), echo=False)
+conn = create_connection()
+instrument_engine(conn.async_engine)
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await asyncio.sleep(5)
+    readiness.starting(conn.async_engine)
+    # The users service creates the tables, so wait until they exist.
+    await wait_for_database(conn.async_engine, select(User.uid).limit(1))
+    await warm_up_pool(conn.async_engine)
     BaseModel.set_session(conn.async_scoped_session)
+    open_password_pool()
+    readiness.mark_ready()
     yield
+    readiness.mark_stopping()
+    close_password_pool()
     await conn.close(BaseModel)
 
 
@@ -29,6 +41,9 @@ app.add_middleware(
     allow_methods=['*'],
     allow_headers=['*'],
 )
+app.add_middleware(MetricsMiddleware)
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(router)
 
 if __name__ == '__main__':
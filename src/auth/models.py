@@ -1,13 +1,12 @@
 from typing import Optional
 from uuid import UUID, uuid4
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerificationError
 from sqlactive import ActiveRecordBaseModel
 from sqlalchemy import Enum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .enums import DocumentType, UserRole
+from .passwords import hash_password, verify_password
 
 
 class BaseModel(ActiveRecordBaseModel):
@@ -35,16 +34,11 @@ class User(BaseModel):
     created_by: Mapped[Optional[UUID]] = mapped_column(nullable=True)
     updated_by: Mapped[Optional[UUID]] = mapped_column(nullable=True)
 
-    def set_password(self, password: str) -> None:
-        ph = PasswordHasher()
-        self.password = ph.hash(password)
+    async def set_password(self, password: str) -> None:
+        self.password = await hash_password(password)
 
-    def verify_password(self, password: str) -> bool:
-        ph = PasswordHasher()
-        try:
-            return ph.verify(self.password, password)
-        except VerificationError:
-            return False
+    async def verify_password(self, password: str) -> bool:
+        return await verify_password(self.password, password)
 
     @classmethod
     async def get_by_username(cls, username: str) -> 'User | None':
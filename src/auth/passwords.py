@@ -0,0 +1,56 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
+
+from .config import Settings
+
+hasher = PasswordHasher(
+    time_cost=Settings.ARGON2_TIME_COST,
+    memory_cost=Settings.ARGON2_MEMORY_COST,
+    parallelism=Settings.ARGON2_PARALLELISM,
+)
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def open_password_pool() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        # argon2-cffi releases the GIL, so the workers hash in parallel.
+        # Each hash holds ARGON2_MEMORY_COST KiB, so the pool size also
+        # bounds the memory used by a burst of logins.
+        workers = Settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='argon2')
+
+    return _executor
+
+
+def close_password_pool() -> None:
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def verify_sync(password_hash: str, password: str) -> bool:
+    try:
+        return hasher.verify(password_hash, password)
+    except VerificationError:
+        return False
+
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(open_password_pool(), hasher.hash, password)
+
+
+async def verify_password(password_hash: str, password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        open_password_pool(), verify_sync, password_hash, password
+    )
@@ -5,9 +5,16 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from .config import Settings
 from .dependencies import oauth2_scheme
-from .dtos import Token, TokenValidation, UserResponse
-from .models import User
-from .service import authenticate_user, get_current_user
+from .dtos import (
+    CacheStats,
+    Token,
+    TokenValidation,
+    UserCacheInvalidation,
+    UserResponse,
+)
+from .enums import UserRole
+from .errors import Forbidden
+from .service import authenticate_user, decode_token, get_current_user, user_cache
 from .token import TokenPayload, create_access_token
 
 router = APIRouter()
@@ -51,5 +58,29 @@ async def validate_token(token: str = Depends(oauth2_scheme)):
 
 
 @router.get('/users/me', response_model=UserResponse, tags=['users'])
-async def read_user_me(current_user: User = Depends(get_current_user)):
-    return UserResponse.model_validate(current_user)
+async def read_user_me(current_user: UserResponse = Depends(get_current_user)):
+    return current_user
+
+
+@router.post('/user-cache/invalidate', status_code=204, tags=['internal'])
+async def invalidate_user_cache(
+    data: UserCacheInvalidation, token: str = Depends(oauth2_scheme)
+):
+    if decode_token(token).role not in (UserRole.ADMIN, UserRole.COMPANY_MANAGER):
+        raise Forbidden
+
+    for username in data.usernames:
+        user_cache.invalidate(username)
+
+
+@router.get('/user-cache/stats', response_model=CacheStats, tags=['internal'])
+async def get_user_cache_stats(token: str = Depends(oauth2_scheme)):
+    if decode_token(token).role != UserRole.ADMIN:
+        raise Forbidden
+
+    return CacheStats(
+        hits=user_cache.hits,
+        misses=user_cache.misses,
+        coalesced=user_cache.coalesced,
+        size=len(user_cache),
+    )
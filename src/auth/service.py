@@ -2,31 +2,56 @@ import jwt
 import pydantic
 from fastapi import Depends
 
+from .cache import AsyncTTLCache
 from .config import Settings
 from .dependencies import oauth2_scheme
+from .dtos import UserResponse
 from .errors import Unauthorized, UserNotFound
 from .models import User
-from .token import TokenPayload
+from .token import TokenPayload, decode_access_token
+
+
+def user_ttl(user: UserResponse | None) -> float:
+    if user is None:
+        return Settings.USER_CACHE_NEGATIVE_TTL
+    return Settings.USER_CACHE_TTL
+
+
+# The users service invalidates entries it changes, so the TTL only bounds
+# staleness when that call is lost or the auth service runs several workers.
+user_cache: AsyncTTLCache[UserResponse | None] = AsyncTTLCache(
+    user_ttl, Settings.USER_CACHE_SIZE
+)
 
 
 async def authenticate_user(username: str, password: str):
     user = await User.get_by_username(username)
-    if not user or not user.verify_password(password):
+    if not user or not await user.verify_password(password):
         return None
 
     return user
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
+async def load_user(username: str) -> UserResponse | None:
+    user = await User.get_by_username(username)
+    if user is None:
+        return None
+
+    return UserResponse.model_validate(user)
+
+
+def decode_token(token: str) -> TokenPayload:
     try:
-        payload = jwt.decode(
-            token, str(Settings.SECRET_KEY), algorithms=[Settings.ALGORITHM]
-        )
-        token_payload = TokenPayload(**payload)
+        return decode_access_token(token)
     except (jwt.PyJWTError, pydantic.ValidationError):
         raise Unauthorized()
 
-    user = await User.get_by_username(token_payload.username)
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
+    token_payload = decode_token(token)
+    user = await user_cache.get(
+        token_payload.username, lambda: load_user(token_payload.username)
+    )
     if user is None:
         raise UserNotFound()
 
@@ -0,0 +1,108 @@
+"""Measure the time and peak memory of parsing an attendances .xlsx upload.
+
+Run it from ``src``. It writes a synthetic workbook (or reuses ``--path``)
+and parses it in this process, either the way the importer does, with a
+read-only workbook streamed straight off the upload, or the way it used
+to, by loading the whole upload into memory and opening it in full mode.
+Run each mode in its own process: the peak memory is the one of the
+whole process, interpreter and imports included.
+"""
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from datetime import datetime
+from io import BytesIO
+
+from fastapi import UploadFile
+from openpyxl import Workbook, load_workbook
+
+from attendances_importer.config import Settings
+from attendances_importer.service import (
+    BASE_FIELDS,
+    iter_attendances,
+    iter_attendances_from_excel,
+)
+
+
+def write_workbook(path: str, rows: int) -> None:
+    wb = Workbook(write_only=True)
+    sheet = wb.create_sheet()
+    sheet.append(BASE_FIELDS)
+    for i in range(rows):
+        sheet.append(
+            [
+                f'Person {i}',
+                str(10_000_000 + i),
+                'CC',
+                'female' if i % 2 else 'male',
+                f'Calle {i % 200} # {i % 97}',
+                datetime(1990, 1, 1 + i % 28),
+                'Consulta',
+            ]
+        )
+    wb.save(path)
+
+
+def parse_streaming(path: str) -> int:
+    with open(path, 'rb') as f:
+        file = UploadFile(file=f, filename=os.path.basename(path))
+        return sum(1 for _ in iter_attendances_from_excel(file))
+
+
+def parse_full(path: str) -> int:
+    with open(path, 'rb') as f:
+        contents = f.read()
+    wb = load_workbook(filename=BytesIO(contents))
+    reader = wb.active.iter_rows(values_only=True, max_row=Settings.MAX_ROWS)
+    return sum(1 for _ in iter_attendances(reader))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--mode', choices=['streaming', 'full'], default='streaming')
+    parser.add_argument(
+        '--memory-limit',
+        type=int,
+        default=0,
+        help='address space limit in MB, 0 for none',
+    )
+    parser.add_argument(
+        '--path',
+        help='.xlsx file, reused if it exists; a temporary one by default',
+    )
+    args = parser.parse_args()
+
+    path = args.path or tempfile.mkstemp(suffix='.xlsx')[1]
+    if not args.path or not os.path.exists(path):
+        started = time.perf_counter()
+        write_workbook(path, args.rows)
+        elapsed = time.perf_counter() - started
+        print(f'# {args.rows} rows written in {elapsed:.1f} s')
+
+    if args.memory_limit > 0:
+        limit = args.memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    Settings.MAX_ROWS = args.rows + 1
+    parse = parse_streaming if args.mode == 'streaming' else parse_full
+    started = time.perf_counter()
+    try:
+        rows = parse(path)
+    except MemoryError:
+        rows = None
+    finally:
+        if not args.path:
+            os.remove(path)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    outcome = f'{rows} rows' if rows is not None else 'MemoryError'
+    print(f'{args.mode}: {outcome} in {elapsed:.1f} s, max RSS {peak:.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
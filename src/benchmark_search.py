@@ -0,0 +1,186 @@
+"""Compare the FTS5 attendance search against the LIKE fallback.
+
+Run it from ``src`` against a throwaway SQLite file. It creates the schema
+and search index the attendances service uses, fills them with synthetic
+rows and times the exact query ``fetch_attendances`` emits for one
+company's first page, with FTS5 and with the ``LIKE`` scan used on other
+backends.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import tempfile
+import time
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import Connection, create_engine, func, insert, literal_column, select
+
+from attendances import search
+from attendances.models import Attendance, BaseModel, create_missing_indexes
+
+REASONS = [
+    'Fiebre',
+    'Control',
+    'Dolor de cabeza',
+    'Vacuna',
+    'Chequeo',
+    'Tos',
+    'Alergia',
+    'Lesion',
+    'Consulta',
+    'Examen',
+]
+BATCH_SIZE = 50_000
+
+
+def words(rnd: random.Random, count: int, length: int) -> list[str]:
+    return [
+        ''.join(rnd.choices(string.ascii_lowercase, k=length)).title()
+        for _ in range(count)
+    ]
+
+
+def fill(
+    connection: Connection,
+    rows: int,
+    companies: list[UUID],
+    vocabulary: dict[str, list[str]],
+    rnd: random.Random,
+) -> None:
+    first_names = vocabulary['first_names']
+    surnames = vocabulary['surnames']
+    streets = vocabulary['streets']
+    started = datetime(2024, 1, 1)
+    batch = []
+    for i in range(rows):
+        created_at = started + timedelta(seconds=i * 3)
+        batch.append(
+            {
+                'uid': UUID(int=rnd.getrandbits(128)),
+                'full_name': f'{rnd.choice(first_names)} {rnd.choice(surnames)}',
+                'document': str(10_000_000 + i),
+                'document_type': 'CC',
+                'gender': 'male',
+                'birth_date': datetime(2000, 1, 1),
+                'address': f'Calle {rnd.choice(streets)} {rnd.randint(1, 200)}',
+                'reason': rnd.choice(REASONS),
+                'company_id': rnd.choice(companies),
+                'created_by': companies[0],
+                'created_at': created_at,
+                'updated_at': created_at,
+            }
+        )
+        if len(batch) == BATCH_SIZE or i == rows - 1:
+            connection.execute(insert(Attendance), batch)
+            batch = []
+
+
+def measure(connection: Connection, statement, budget: float) -> float:
+    """Return the median time in milliseconds of ``statement``."""
+    connection.execute(statement).fetchall()
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < 3 or time.perf_counter() - started < budget:
+        start = time.perf_counter()
+        connection.execute(statement).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def search_statement(company_id: UUID, term: str, fts: bool, page: int):
+    """Build the query of ``fetch_attendances(company_id, 0, page, term)``."""
+    search._fts_enabled = fts
+    query = Attendance.get_async_query()
+    query.limit(page)
+    query.find(Attendance.company_id == company_id)
+    search.apply_search(query, term, company_id)
+    return query.query
+
+
+def count_matches(connection: Connection, company_id: UUID, term: str) -> int:
+    expression = search.to_match_expression(term, company_id)
+    statement = (
+        select(func.count())
+        .select_from(search.attendances_fts)
+        .where(literal_column(search.FTS_TABLE).op('MATCH')(expression))
+    )
+    return connection.execute(statement).scalar_one()
+
+
+def create_search_index(connection: Connection) -> None:
+    search.create_search_index(connection)
+    if not search._fts_enabled:
+        raise SystemExit('This SQLite build has no FTS5')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--companies', type=int, default=100)
+    parser.add_argument('--page', type=int, default=50)
+    parser.add_argument('--budget', type=float, default=2.0, help='seconds per query')
+    parser.add_argument(
+        '--path',
+        help='SQLite file, reused if it exists; a temporary one by default',
+    )
+    args = parser.parse_args()
+
+    path = args.path or tempfile.mkstemp(suffix='.sqlite3')[1]
+    reuse = bool(args.path) and os.path.exists(path)
+    if not reuse and os.path.exists(path):
+        os.remove(path)
+
+    rnd = random.Random(42)
+    companies = [UUID(int=rnd.getrandbits(128)) for _ in range(args.companies)]
+    # A rare, a medium and a common search term: a surname out of 2000, a
+    # first name out of 300 and a reason out of 10.
+    vocabulary = {
+        'first_names': words(rnd, 300, 6),
+        'surnames': words(rnd, 2000, 7),
+        'streets': words(rnd, 500, 8),
+    }
+    terms = {
+        'rare': vocabulary['surnames'][0].lower(),
+        'medium': vocabulary['first_names'][0].lower(),
+        'common': REASONS[0].lower(),
+    }
+    engine = create_engine(f'sqlite:///{path}')
+    try:
+        with engine.begin() as connection:
+            if not reuse:
+                BaseModel.metadata.create_all(connection)
+                create_missing_indexes(connection)
+                started = time.perf_counter()
+                fill(connection, args.rows, companies, vocabulary, rnd)
+                elapsed = time.perf_counter() - started
+                print(f'# {args.rows} rows loaded in {elapsed:.1f} s')
+
+            started = time.perf_counter()
+            create_search_index(connection)
+            print(f'# search index built in {time.perf_counter() - started:.1f} s')
+
+        company_id = companies[0]
+        print('term     matches    LIKE ms    FTS5 ms')
+        with engine.connect() as connection:
+            for label, term in terms.items():
+                like = search_statement(company_id, term, False, args.page)
+                fts = search_statement(company_id, term, True, args.page)
+                matches = count_matches(connection, company_id, term)
+                print(
+                    f'{label:<8} {matches:>7} '
+                    f'{measure(connection, like, args.budget):>10.2f} '
+                    f'{measure(connection, fts, args.budget):>10.2f}'
+                )
+    finally:
+        engine.dispose()
+        if not args.path:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Pick Argon2 parameters for a target hashing latency on this host.
+
+Run it on the deployment host (or inside the service container) and copy
+the printed settings into the ``.env`` file used by the auth and users
+services. Existing hashes keep verifying after a change, because their
+parameters are stored in the hash itself.
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+MIN_MEMORY_COST = 19456
+
+
+def measure(hasher: PasswordHasher, samples: int) -> float:
+    """Return the median time in milliseconds of one hash."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash('calibration-password')
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float, memory_cost: int, parallelism: int, samples: int
+) -> tuple[PasswordHasher, float]:
+    """Return the cheapest hasher whose latency reaches ``target_ms``.
+
+    The memory cost is halved (down to the OWASP minimum) while a single
+    pass is already slower than the target, then the time cost is raised
+    until the target is reached.
+    """
+    time_cost = 1
+    while True:
+        hasher = PasswordHasher(time_cost, memory_cost, parallelism)
+        elapsed = measure(hasher, samples)
+        if elapsed <= target_ms or memory_cost // 2 < MIN_MEMORY_COST:
+            break
+
+        memory_cost //= 2
+
+    while elapsed < target_ms:
+        time_cost += 1
+        hasher = PasswordHasher(time_cost, memory_cost, parallelism)
+        elapsed = measure(hasher, samples)
+
+    return hasher, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--target-ms', type=float, default=250.0, help='per-hash latency'
+    )
+    parser.add_argument(
+        '--memory-cost', type=int, default=65536, help='starting memory in KiB'
+    )
+    parser.add_argument('--parallelism', type=int, default=4)
+    parser.add_argument('--samples', type=int, default=5)
+    args = parser.parse_args()
+
+    hasher, elapsed = calibrate(
+        args.target_ms, args.memory_cost, args.parallelism, args.samples
+    )
+    workers = min(4, os.cpu_count() or 1)
+    print(f'# {elapsed:.1f} ms per hash, up to {workers} hashes at a time')
+    print(f'ARGON2_TIME_COST={hasher.time_cost}')
+    print(f'ARGON2_MEMORY_COST={hasher.memory_cost}')
+    print(f'ARGON2_PARALLELISM={hasher.parallelism}')
+    print(f'PASSWORD_HASH_WORKERS={workers}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+from typing import Any
+
+from sqlactive import DBConnection
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from .config import Settings
+
+
+def sqlite_pragmas() -> dict[str, object]:
+    pragmas = {
+        'journal_mode': Settings.SQLITE_JOURNAL_MODE,
+        'synchronous': Settings.SQLITE_SYNCHRONOUS,
+        'busy_timeout': Settings.SQLITE_BUSY_TIMEOUT,
+        'cache_size': Settings.SQLITE_CACHE_SIZE,
+        'mmap_size': Settings.SQLITE_MMAP_SIZE,
+    }
+    return {name: value for name, value in pragmas.items() if value != ''}
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for name, value in sqlite_pragmas().items():
+        cursor.execute(f'PRAGMA {name}={value}')
+    cursor.close()
+
+
+def create_connection() -> DBConnection:
+    """Create the service's connection using the configured engine profile.
+
+    On SQLite the pragmas are applied to every new DBAPI connection. WAL
+    lets readers run alongside a writer, and ``busy_timeout`` makes a
+    second writer wait for the lock instead of failing with "database is
+    locked". Pool sizing only applies to file databases, since in-memory
+    SQLite uses a single static connection.
+    """
+    url = make_url(str(Settings.DATABASE_URL))
+    options: dict[str, Any] = {}
+    if url.get_backend_name() != 'sqlite' or url.database not in (None, '', ':memory:'):
+        options['pool_size'] = Settings.DB_POOL_SIZE
+        options['max_overflow'] = Settings.DB_MAX_OVERFLOW
+
+    conn = DBConnection(url, echo=False, **options)
+    if url.get_backend_name() == 'sqlite':
+        event.listen(conn.async_engine.sync_engine, 'connect', apply_sqlite_pragmas)
+
+    return conn
@@ -42,3 +42,12 @@ class CompanyResponse(BaseModel):
     additional_attendance_fields: list[AdditionalAttendanceField] | None = None
     created_by: UUID | None = None
     updated_by: UUID | None = None
+
+
+class CompanyLookup(BaseModel):
+    uids: list[UUID] = Field(default=[], max_length=500)
+    nits: list[str] = Field(default=[], max_length=500)
+
+
+class CompanyLookupResponse(BaseModel):
+    companies: dict[str, CompanyResponse]
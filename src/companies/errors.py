@@ -32,3 +32,11 @@ class NoCompanyId(HTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='User does not belong to any company',
         )
+
+
+class InvalidCursor(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid pagination cursor',
+        )
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from time import monotonic, perf_counter
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import Executable, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .config import Settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class Readiness:
+    def __init__(self) -> None:
+        self.ready = False
+        self.started_at = perf_counter()
+        self.startup_seconds: float | None = None
+        self.engine: AsyncEngine | None = None
+
+    def starting(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.started_at = perf_counter()
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.startup_seconds = round(perf_counter() - self.started_at, 3)
+        logger.info('Ready to serve after %.3f s', self.startup_seconds)
+
+    def mark_stopping(self) -> None:
+        self.ready = False
+
+
+readiness = Readiness()
+
+
+async def wait_for_database(
+    engine: AsyncEngine, probe: Executable | None = None
+) -> None:
+    """Run ``probe`` (``SELECT 1`` by default) until it succeeds, backing
+    off exponentially between attempts, and give up after
+    ``STARTUP_TIMEOUT`` seconds.
+    """
+    if probe is None:
+        probe = text('SELECT 1')
+
+    delay = Settings.STARTUP_RETRY_DELAY
+    deadline = monotonic() + Settings.STARTUP_TIMEOUT
+    while True:
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(probe)
+            return
+        except SQLAlchemyError as e:
+            if monotonic() + delay > deadline:
+                raise
+
+            logger.warning(
+                'Database is not ready (%s), retrying in %.2f s',
+                getattr(e, 'orig', None) or e,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, Settings.STARTUP_RETRY_MAX_DELAY)
+
+
+async def warm_up_pool(engine: AsyncEngine) -> None:
+    """Open the pool's connections up front so the first requests after
+    a start do not pay for them.
+    """
+    size = getattr(engine.pool, 'size', lambda: 1)()
+    connections = [await engine.connect() for _ in range(size)]
+    for connection in connections:
+        await connection.close()
+
+
+@router.get('/healthz', tags=['health'])
+async def healthz():
+    return {'status': 'ok'}
+
+
+@router.get('/readyz', tags=['health'])
+async def readyz():
+    content = {'status': 'ready', 'startup_seconds': readiness.startup_seconds}
+    if not readiness.ready or readiness.engine is None:
+        content['status'] = 'not ready'
+        return JSONResponse(content, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    try:
+        async with readiness.engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+    except SQLAlchemyError:
+        content['status'] = 'database unavailable'
+        return JSONResponse(content, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    return content
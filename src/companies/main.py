@@ -4,20 +4,32 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi_auth_middleware import AuthMiddleware
-from sqlactive import DBConnection
 
-from .config import Settings
+from .database import create_connection
+from .dtos import CompanyResponse
+from .health import readiness, wait_for_database, warm_up_pool
+from .health import router as health_router
+from .metrics import MetricsMiddleware, instrument_engine
+from .metrics import router as metrics_router
 from .models import BaseModel
+from .responses import list_adapter
 from .routes import router
 from .token import verify_authorization_header
 
-conn = DBConnection(str(Settings.DATABASE_URL), echo=False)
+conn = create_connection()
+instrument_engine(conn.async_engine)
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    readiness.starting(conn.async_engine)
+    await wait_for_database(conn.async_engine)
     await conn.init_db(BaseModel)
+    await warm_up_pool(conn.async_engine)
+    list_adapter(CompanyResponse)
+    readiness.mark_ready()
     yield
+    readiness.mark_stopping()
     await conn.close(BaseModel)
 
 
@@ -28,8 +40,12 @@ app.add_middleware(
     allow_origins=['*'],
     allow_methods=['*'],
     allow_headers=['*'],
+    expose_headers=['X-Next-Cursor'],
 )
 app.add_middleware(AuthMiddleware, verify_header=verify_authorization_header)  # type: ignore
+app.add_middleware(MetricsMiddleware)
+app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(router)
 
 if __name__ == '__main__':
@@ -0,0 +1,32 @@
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+@cache
+def list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def list_response(
+    model: type[BaseModel],
+    rows: Sequence[Any],
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Validate ``rows`` into ``model`` once and serialize them straight
+    to JSON bytes with pydantic-core.
+
+    Returning a ``Response`` skips the validation and encoding FastAPI
+    would run again for the route's ``response_model``, which is kept
+    only for the OpenAPI schema.
+    """
+    adapter = list_adapter(model)
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(
+        adapter.dump_json(items),
+        headers=headers,
+        media_type='application/json',
+    )
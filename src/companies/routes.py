@@ -6,15 +6,20 @@ from starlette.requests import Request
 
 from .dtos import (
     CompanyCreate,
+    CompanyLookup,
+    CompanyLookupResponse,
     CompanyResponse,
     CompanyUpdate,
     ResourceDelete,
 )
 from .enums import UserRole
 from .errors import CompanyNotFound
+from .pagination import next_cursor
+from .responses import list_response
 from .service import (
     create_new_company,
     fetch_companies,
+    lookup_companies,
     read_company,
     update_company,
 )
@@ -36,9 +41,14 @@ async def get_companies(
     skip: int = 0,
     limit: int = 100,
     search: str | None = None,
+    cursor: str | None = None,
 ):
-    companies = await fetch_companies(skip, limit, search)
-    return [CompanyResponse.model_validate(company) for company in companies]
+    companies = await fetch_companies(skip, limit, search, cursor)
+    headers: dict[str, str] = {}
+    if next_page := next_cursor(companies, limit):
+        headers['X-Next-Cursor'] = next_page
+
+    return list_response(CompanyResponse, companies, headers)
 
 
 @router.get('/companies/me', response_model=CompanyResponse, tags=['companies'])
@@ -64,6 +74,22 @@ async def get_company(request: Request, uid: UUID):
     return CompanyResponse.model_validate(company)
 
 
+@router.post(
+    '/companies/lookup',
+    response_model=CompanyLookupResponse,
+    tags=['companies'],
+)
+@requires(UserRole.COMPANY_MANAGER)
+async def get_companies_lookup(request: Request, data: CompanyLookup):
+    companies = await lookup_companies(request.user, data)
+    return CompanyLookupResponse(
+        companies={
+            key: CompanyResponse.model_validate(company)
+            for key, company in companies.items()
+        }
+    )
+
+
 @router.get(
     '/companies/by_nit/{nit}',
     response_model=CompanyResponse,
@@ -1,15 +1,28 @@
 from uuid import UUID
 
-from .dtos import CompanyCreate, CompanyUpdate
+from sqlalchemy import or_
+
+from .dtos import CompanyCreate, CompanyLookup, CompanyUpdate
 from .enums import UserRole
 from .errors import CompanyAlreadyExists
 from .models import Company
+from .pagination import after_cursor, page_size
 from .token import AuthenticatedUser
 
 
-async def fetch_companies(skip: int = 0, limit: int = 100, search: str | None = None):
+async def fetch_companies(
+    skip: int = 0,
+    limit: int = 100,
+    search: str | None = None,
+    cursor: str | None = None,
+):
     query = Company.get_async_query()
-    query.skip(skip).limit(limit if limit > 0 else 100).sort('-created_at')
+    query.limit(page_size(limit)).sort('-created_at', '-uid')
+
+    if cursor:
+        query.find(after_cursor(Company.created_at, Company.uid, cursor))
+    else:
+        query.skip(skip)
 
     if search:
         query.search(search)
@@ -32,6 +45,26 @@ async def read_company(read_by: AuthenticatedUser, uid_or_nit: str | UUID):
     return company
 
 
+async def lookup_companies(read_by: AuthenticatedUser, data: CompanyLookup):
+    if not data.uids and not data.nits:
+        return {}
+
+    query = Company.where(or_(Company.uid.in_(data.uids), Company.nit.in_(data.nits)))
+    if read_by.role != UserRole.ADMIN:
+        query.find(Company.uid == read_by.company_id)
+
+    uids = set(data.uids)
+    nits = set(data.nits)
+    companies = {}
+    for company in await query.all():
+        if company.uid in uids:
+            companies[str(company.uid)] = company
+        if company.nit in nits:
+            companies[company.nit] = company
+
+    return companies
+
+
 async def create_new_company(created_by: AuthenticatedUser, data: CompanyCreate):
     company = await Company.get_by_nit(nit=data.nit)
     if company:
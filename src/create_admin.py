@@ -1,22 +1,22 @@
 from getpass import getpass
 
 from dotenv import load_dotenv
-from sqlactive import DBConnection
 
-from users.config import Settings
+from users.database import create_connection
 from users.enums import UserRole
 from users.models import BaseModel, User
+from users.passwords import close_password_pool, hash_password
 
 load_dotenv()
 
 
 async def create_admin():
-    conn = DBConnection(str(Settings.DATABASE_URL), echo=False)
+    conn = create_connection()
     BaseModel.set_session(conn.async_scoped_session)
 
     user = await User.create(
         username=input('Username: '),
-        password=getpass('Password: '),
+        password=await hash_password(getpass('Password: ')),
         email='admin@yopmail.com',
         document='1234567890',
         document_type='CC',
@@ -25,6 +25,7 @@ async def create_admin():
         role=UserRole.ADMIN,
         phone_number='1234567890',
     )
+    close_password_pool()
     await conn.close(BaseModel)
     print(f'Admin created with uid {user.uid}')
 
@@ -15,4 +15,29 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES = config(
         'ACCESS_TOKEN_EXPIRE_MINUTES', cast=int, default=30
     )
+    TOKEN_CACHE_SIZE = config('TOKEN_CACHE_SIZE', cast=int, default=1024)
+    ARGON2_TIME_COST = config('ARGON2_TIME_COST', cast=int, default=3)
+    ARGON2_MEMORY_COST = config('ARGON2_MEMORY_COST', cast=int, default=65536)
+    ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', cast=int, default=4)
+    PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', cast=int, default=0)
+    AUTH_URL = config('AUTH_URL', default='http://localhost:8000')
     COMPANIES_URL = config('COMPANIES_URL', default='http://localhost:8002')
+    HTTP2 = config('HTTP2', cast=bool, default=False)
+    HTTP_MAX_CONNECTIONS = config('HTTP_MAX_CONNECTIONS', cast=int, default=100)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = config(
+        'HTTP_MAX_KEEPALIVE_CONNECTIONS', cast=int, default=20
+    )
+    HTTP_KEEPALIVE_EXPIRY = config('HTTP_KEEPALIVE_EXPIRY', cast=float, default=5.0)
+    HTTP_TIMEOUT = config('HTTP_TIMEOUT', cast=float, default=5.0)
+    HTTP_CONNECT_TIMEOUT = config('HTTP_CONNECT_TIMEOUT', cast=float, default=5.0)
+    HTTP_POOL_TIMEOUT = config('HTTP_POOL_TIMEOUT', cast=float, default=5.0)
+    STARTUP_TIMEOUT = config('STARTUP_TIMEOUT', cast=float, default=60.0)
+    STARTUP_RETRY_DELAY = config('STARTUP_RETRY_DELAY', cast=float, default=0.1)
+    STARTUP_RETRY_MAX_DELAY = config('STARTUP_RETRY_MAX_DELAY', cast=float, default=2.0)
+    DB_POOL_SIZE = config('DB_POOL_SIZE', cast=int, default=5)
+    DB_MAX_OVERFLOW = config('DB_MAX_OVERFLOW', cast=int, default=10)
+    SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+    SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+    SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default='5000')
+    SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default='-16000')
+    SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default='134217728')
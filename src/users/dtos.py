@@ -59,3 +59,14 @@ class UserResponse(BaseModel):
     company_id: UUID | None = None
     created_by: UUID | None = None
     updated_by: UUID | None = None
+
+
+class HTTPPoolStats(BaseModel):
+    max_connections: int
+    max_keepalive_connections: int
+    http2: bool
+    connections: int
+    active: int
+    idle: int
+    queued_requests: int
+    unavailable: bool = False
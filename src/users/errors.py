@@ -39,3 +39,11 @@ class CompanyRequired(HTTPException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='Company id is required',
         )
+
+
+class InvalidCursor(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Invalid pagination cursor',
+        )
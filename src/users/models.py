@@ -1,12 +1,12 @@
 from typing import Optional
 from uuid import UUID, uuid4
 
-from argon2 import PasswordHasher
 from sqlactive import ActiveRecordBaseModel
 from sqlalchemy import Enum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .enums import DocumentType, UserRole
+from .passwords import hash_password
 
 
 class BaseModel(ActiveRecordBaseModel):
@@ -34,9 +34,8 @@ class User(BaseModel):
     created_by: Mapped[Optional[UUID]] = mapped_column(nullable=True)
     updated_by: Mapped[Optional[UUID]] = mapped_column(nullable=True)
 
-    def set_password(self, password: str) -> None:
-        ph = PasswordHasher()
-        self.password = ph.hash(password)
+    async def set_password(self, password: str) -> None:
+        self.password = await hash_password(password)
 
     @classmethod
     async def get_by_username(cls, username: str) -> 'User | None':
@@ -4,10 +4,25 @@ from fastapi import APIRouter
 from starlette.authentication import requires
 from starlette.requests import Request
 
-from .dtos import ResourceDelete, UserCreate, UserResponse, UserUpdate
+from .dtos import (
+    HTTPPoolStats,
+    ResourceDelete,
+    UserCreate,
+    UserResponse,
+    UserUpdate,
+)
 from .enums import UserRole
 from .errors import Forbidden, NoCompanyId, UserNotFound
-from .service import create_new_user, fetch_users, read_user, update_user
+from .http_client import http_pool_stats
+from .pagination import next_cursor
+from .responses import list_response
+from .service import (
+    create_new_user,
+    fetch_users,
+    read_user,
+    remove_user,
+    update_user,
+)
 
 router = APIRouter()
 
@@ -40,10 +55,15 @@ async def get_users(
     skip: int = 0,
     limit: int = 100,
     search: str | None = None,
+    cursor: str | None = None,
 ):
     check_company_id(request)
-    users = await fetch_users(request.user.company_id, skip, limit, search)
-    return [UserResponse.model_validate(user) for user in users]
+    users = await fetch_users(request.user.company_id, skip, limit, search, cursor)
+    headers: dict[str, str] = {}
+    if next_page := next_cursor(users, limit):
+        headers['X-Next-Cursor'] = next_page
+
+    return list_response(UserResponse, users, headers)
 
 
 @router.get('/users/{uid:uuid}', response_model=UserResponse, tags=['users'])
@@ -94,5 +114,11 @@ async def delete_user(request: Request, uid: UUID):
         raise UserNotFound
 
     uid = user.uid
-    await user.delete()
+    await remove_user(request.user, user)
     return ResourceDelete(uid=uid)
+
+
+@router.get('/http-pool/stats', response_model=HTTPPoolStats, tags=['internal'])
+@requires(UserRole.ADMIN)
+async def get_http_pool_stats(request: Request):
+    return HTTPPoolStats(**http_pool_stats())
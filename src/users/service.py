@@ -1,24 +1,28 @@
 import json
+import logging
 from uuid import UUID
 
 import httpx
-from argon2 import PasswordHasher
 from fastapi import HTTPException
 
 from .config import Settings
 from .dtos import UserCreate, UserUpdate
 from .enums import UserRole
 from .errors import CompanyRequired, UserAlreadyExists
+from .http_client import get_http_client
 from .models import User
+from .pagination import after_cursor, page_size
+from .passwords import hash_password
 from .token import AuthenticatedUser
 
+logger = logging.getLogger(__name__)
+
 
 async def fetch_company_by_id(company_id: UUID, access_token: str):
-    async with httpx.AsyncClient() as client:
-        return await client.get(
-            f'{Settings.COMPANIES_URL}/companies/{company_id}',
-            headers={'Authorization': 'Bearer ' + access_token},
-        )
+    return await get_http_client().get(
+        f'{Settings.COMPANIES_URL}/companies/{company_id}',
+        headers={'Authorization': 'Bearer ' + access_token},
+    )
 
 
 async def check_company_exists(company_id: UUID, access_token: str):
@@ -35,14 +39,37 @@ async def check_company_exists(company_id: UUID, access_token: str):
         )
 
 
+async def invalidate_cached_users(access_token: str, *usernames: str) -> None:
+    """Drop ``usernames`` from the auth service's user cache.
+
+    A failure is only logged, since the cached entries also expire on
+    their own.
+    """
+    try:
+        response = await get_http_client().post(
+            f'{Settings.AUTH_URL}/user-cache/invalidate',
+            json={'usernames': list(usernames)},
+            headers={'Authorization': 'Bearer ' + access_token},
+        )
+        response.raise_for_status()
+    except httpx.HTTPError:
+        logger.warning('Could not invalidate cached users %s', usernames)
+
+
 async def fetch_users(
     company_id: UUID | None = None,
     skip: int = 0,
     limit: int = 100,
     search: str | None = None,
+    cursor: str | None = None,
 ):
     query = User.get_async_query()
-    query.skip(skip).limit(limit if limit > 0 else 100).sort('-created_at')
+    query.limit(page_size(limit)).sort('-created_at', '-uid')
+
+    if cursor:
+        query.find(after_cursor(User.created_at, User.uid, cursor))
+    else:
+        query.skip(skip)
 
     if search:
         query.search(search)
@@ -73,8 +100,7 @@ async def create_new_user(created_by: AuthenticatedUser, data: UserCreate):
     if user:
         raise UserAlreadyExists
 
-    ph = PasswordHasher()
-    data.password = ph.hash(data.password)
+    data.password = await hash_password(data.password)
 
     create_data = data.model_dump()
     create_data.pop('confirm_password', None)
@@ -101,7 +127,7 @@ async def update_user(updated_by: AuthenticatedUser, uid: UUID, data: UserUpdate
         return None
 
     if data.password:
-        user.set_password(data.password)
+        await user.set_password(data.password)
 
     update_data = data.model_dump()
     update_data.pop('password', None)
@@ -117,4 +143,11 @@ async def update_user(updated_by: AuthenticatedUser, uid: UUID, data: UserUpdate
 
         await check_company_exists(company_id, updated_by.access_token)
 
-    return await user.update(**update_data, updated_by=updated_by.uid)
+    user = await user.update(**update_data, updated_by=updated_by.uid)
+    await invalidate_cached_users(updated_by.access_token, user.username)
+    return user
+
+
+async def remove_user(deleted_by: AuthenticatedUser, user: User) -> None:
+    await user.delete()
+    await invalidate_cached_users(deleted_by.access_token, user.username)
@@ -1,6 +1,8 @@
 import json
+from collections import OrderedDict
 from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
+from time import time
 from uuid import UUID
 
 import jwt
@@ -56,11 +58,55 @@ def create_access_token(data: TokenPayload, expires_delta: timedelta | None = No
     )
 
 
+class TokenCache:
+    """LRU of verified tokens. Entries are dropped once the token's
+    ``exp`` has passed, so an expired token is always decoded again and
+    rejected by ``jwt.decode``.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, TokenPayload]] = OrderedDict()
+
+    def get(self, token: str) -> TokenPayload | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time():
+            del self._entries[token]
+            return None
+
+        self._entries.move_to_end(token)
+        return payload
+
+    def set(self, token: str, payload: TokenPayload, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._entries[token] = (expires_at, payload)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+token_cache = TokenCache(Settings.TOKEN_CACHE_SIZE)
+
+
 def decode_access_token(token: str) -> TokenPayload:
-    payload = jwt.decode(
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
+    claims = jwt.decode(
         token, str(Settings.SECRET_KEY), algorithms=[Settings.ALGORITHM]
     )
-    return TokenPayload.model_validate(payload)
+    payload = TokenPayload.model_validate(claims)
+    if 'exp' in claims:
+        token_cache.set(token, payload, claims['exp'])
+
+    return payload
 
 
 def verify_authorization_header(